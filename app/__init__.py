@@ -3,6 +3,7 @@ import os
 from flask import Flask, jsonify, request, render_template, url_for
 from config import Config
 from app.extensions import cache, limiter
+from app.json_provider import JSONProvider, OrjsonProvider, orjson
 
 
 def _wants_json():
@@ -33,6 +34,8 @@ def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
 
+    app.json = OrjsonProvider(app) if orjson is not None else JSONProvider(app)
+
     cache.init_app(app)
     limiter.init_app(app)
 
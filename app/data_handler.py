@@ -2,14 +2,26 @@ import json
 import os
 import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple
 
 from flask import current_app
 from app.extensions import cache
+from datafiles import bisect_date, cached_parse, list_data_files, load_cached
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    'get_date_range_days',
+    'filter_history_by_range',
+    'build_market_summary',
+    'get_all_commodities',
+    'get_commodity',
+]
+
 DAILY_SOURCE_TYPES = {'EIA', 'YAHOO', 'FREEGOLD'}
 DAILY_COMMODITY_IDS = {
     'brent_oil',
@@ -42,28 +54,33 @@ def get_date_range_days(date_range: str) -> Optional[int]:
     }
     return ranges.get(date_range, None)
 
+
 def filter_history_by_range(history: List[Dict[str, Any]], date_range: str) -> List[Dict[str, Any]]:
     """Filter history for display purposes only.
     
     Uses the latest observation date as reference (not current date).
     This handles datasets that aren't up-to-date.
+
+    Assumes *history* is sorted ascending by ISO date, as the fetchers write
+    it (see scripts/fetchers/_shared.merge_history): the window start is found
+    by binary search, so an out-of-order list is cut at an arbitrary point.
+    Entries without a date are dropped.
     """
     days = get_date_range_days(date_range)
     if days is None or not history:
         return history
     
     try:
-        latest_date = datetime.strptime(history[-1]['date'], '%Y-%m-%d')
-    except (ValueError, KeyError, IndexError):
+        latest_date = date.fromisoformat(history[-1]['date'])
+    except (ValueError, TypeError, KeyError, IndexError):
         return history
     
     cutoff_date = latest_date - timedelta(days=days)
-    cutoff_date_str = cutoff_date.strftime('%Y-%m-%d')
-    filtered = []
-    for entry in history:
-        date_str = entry.get('date', '')
-        if date_str and date_str >= cutoff_date_str:
-            filtered.append(entry)
+    cutoff_date_str = cutoff_date.isoformat()
+    # ISO dates sort lexicographically, so on the oldest-first history the
+    # window start is a binary search instead of a scan over every entry.
+    start = bisect_date(history, cutoff_date_str)
+    filtered = [entry for entry in history[start:] if entry.get('date')]
 
     if not filtered:
         logger.warning(
@@ -145,10 +162,20 @@ def _infer_is_daily(item: Dict[str, Any], history: List[Dict[str, Any]]) -> bool
     if len(history) < 3:
         return False
 
-    parsed_dates: List[datetime] = []
-    for entry in history[-40:]:
+    return _dates_look_daily(tuple(entry.get('date', '') for entry in history[-40:]))
+
+
+@lru_cache(maxsize=512)
+def _dates_look_daily(dates: Tuple[Any, ...]) -> bool:
+    """Median-interval cadence check over a window of observation dates.
+
+    Memoized on the date window: it only changes when a data file gains a new
+    observation, so repeat renders skip the per-date parsing.
+    """
+    parsed_dates: List[date] = []
+    for date_str in dates:
         try:
-            parsed_dates.append(datetime.strptime(entry.get('date', ''), '%Y-%m-%d'))
+            parsed_dates.append(date.fromisoformat(date_str))
         except (TypeError, ValueError):
             continue
 
@@ -195,12 +222,12 @@ def _first_finite_value(item: Dict[str, Any], keys: List[str]) -> float:
     return 0.0
 
 
-def _parse_date(date_value: Any) -> Optional[datetime]:
+def _parse_date(date_value: Any) -> Optional[date]:
     """Parse the project date format safely."""
     if not date_value:
         return None
     try:
-        return datetime.strptime(str(date_value), '%Y-%m-%d')
+        return date.fromisoformat(str(date_value))
     except ValueError:
         return None
 
@@ -258,7 +285,7 @@ def build_market_summary(commodities: List[Dict[str, Any]]) -> Dict[str, Any]:
         return summary
 
     category_totals: Dict[str, Dict[str, Any]] = {}
-    dated_items: List[tuple[datetime, Dict[str, Any]]] = []
+    dated_items: List[tuple[date, Dict[str, Any]]] = []
     movers: List[Dict[str, Any]] = []
 
     for item in commodities:
@@ -326,10 +353,9 @@ def build_market_summary(commodities: List[Dict[str, Any]]) -> Dict[str, Any]:
         summary['headline'] = 'Benchmarks were evenly split'
 
     if dated_items:
-        latest_date = max(date for date, _item in dated_items)
-        latest_date_str = latest_date.strftime('%Y-%m-%d')
-        summary['latest_date'] = latest_date_str
-        summary['latest_count'] = sum(1 for date, _item in dated_items if date == latest_date)
+        latest_date = max(day for day, _item in dated_items)
+        summary['latest_date'] = latest_date.isoformat()
+        summary['latest_count'] = sum(1 for day, _item in dated_items if day == latest_date)
 
     risers = sorted(
         (m for m in movers if m['change_percent'] > 0),
@@ -357,53 +383,119 @@ def build_market_summary(commodities: List[Dict[str, Any]]) -> Dict[str, Any]:
     return summary
 
 
-@cache.memoize(timeout=600)
+class _StaleWhileRevalidate:
+    """Serve the last built value per key and rebuild it off the request thread.
+
+    The first request for a key builds synchronously. After that, a value
+    ``ttl_seconds`` or older is still returned immediately while a single
+    daemon thread rebuilds it; a failed rebuild keeps serving the old value.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._refreshing: Set[Hashable] = set()
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            value = build()
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+            return value
+
+        built_at, value = entry
+        if time.monotonic() - built_at >= self.ttl_seconds:
+            self._refresh_in_background(key, build)
+        return value
+
+    def _refresh_in_background(self, key: Hashable, build: Callable[[], Any]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        threading.Thread(target=self._refresh, args=(key, build), daemon=True).start()
+
+    def _refresh(self, key: Hashable, build: Callable[[], Any]) -> None:
+        try:
+            value = build()
+        except Exception:
+            logger.exception("Background refresh failed for %r; serving previous snapshot", key)
+        else:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), value)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+
+# Assembled commodity lists keyed by (data_dir, date_range, include_history).
+# This is get_all_commodities' only cache: it is not also memoized, so a
+# rebuilt list is served as soon as its background refresh finishes.
+_COMMODITIES_SNAPSHOTS = _StaleWhileRevalidate(ttl_seconds=60.0)
+
+
 def get_all_commodities(date_range: str = 'ALL', include_history: bool = True) -> List[Dict[str, Any]]:
     """Load all commodities with display-filtered history.
     
     Uses pre-computed metrics from derived.descriptive_stats.
     Does NOT recompute financial calculations in the UI layer.
+    Served from a stale-while-revalidate snapshot, so disk reads and parsing
+    happen on a background thread once the first build exists. Each call gets
+    its own item dicts; nested values such as ``history`` are shared and
+    must be treated as read-only.
     """
     data_dir = current_app.config['JSON_DATA_DIR']
+    snapshot = _COMMODITIES_SNAPSHOTS.get(
+        (data_dir, date_range, include_history),
+        lambda: _build_all_commodities(data_dir, date_range, include_history),
+    )
+    return [dict(item) for item in snapshot]
+
+
+def _build_all_commodities(data_dir: str, date_range: str, include_history: bool) -> List[Dict[str, Any]]:
+    """Assemble the commodity list for *data_dir* (no app context needed)."""
     commodities = []
-    
-    if not os.path.exists(data_dir):
+
+    try:
+        data_files = list_data_files(data_dir)
+    except FileNotFoundError:
         return commodities
 
-    for filename in os.listdir(data_dir):
-        if filename.endswith('.json') and filename != 'schema.json':
-            # Only load files whose id passes the same validation as get_commodity,
-            # so a stray/unsafe-named *.json can't enter the public list.
-            cid = filename[:-5]
-            if not _is_safe_commodity_id(cid):
-                logger.warning("Skipping file with unsafe id: %s", filename)
-                continue
-            try:
-                with open(os.path.join(data_dir, filename), 'r') as f:
-                    item = json.load(f)
-
-                    # Filter history for display only
-                    full_history = item.get('history', [])
-                    filtered_history = filter_history_by_range(full_history, date_range)
-                    if include_history:
-                        item['history'] = filtered_history
-                    else:
-                        item.pop('history', None)
-                    
-                    _apply_latest_display_point(item, filtered_history)
-                    # _set_display_change_fields_from_history overwrites the same change/change_percent
-                    # fields that _hydrate_change_fields would set, so skip the latter here.
-                    # _hydrate_change_fields is still used by get_commodity (no history recalculation).
-                    _set_display_change_fields_from_history(item, filtered_history)
-                    # Expose derived stats for list views (grid tooltips, compact table)
-                    item['derived_stats'] = item.get('derived', {}).get('descriptive_stats', {})
-                    _set_frequency_fields(item, full_history)
-                        
-                    commodities.append(item)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning("Skipping %s: %s", filename, e)
-                continue
-    
+    for filename, path in data_files:
+        # Only load files whose id passes the same validation as get_commodity,
+        # so a stray/unsafe-named *.json can't enter the public list.
+        cid = filename[:-5]
+        if not _is_safe_commodity_id(cid):
+            logger.warning("Skipping file with unsafe id: %s", filename)
+            continue
+        try:
+            source = cached_parse(path)
+
+            # Filter history for display only. The item is a shallow overlay
+            # on the cached parse; history entries are shared, not copied.
+            full_history = source.get('history', [])
+            filtered_history = filter_history_by_range(full_history, date_range)
+            item = {k: v for k, v in source.items() if k != 'history'}
+            if include_history:
+                item['history'] = filtered_history
+
+            _apply_latest_display_point(item, filtered_history)
+            # _set_display_change_fields_from_history overwrites the same change/change_percent
+            # fields that _hydrate_change_fields would set, so skip the latter here.
+            # _hydrate_change_fields is still used by get_commodity (no history recalculation).
+            _set_display_change_fields_from_history(item, filtered_history)
+            # Expose derived stats for list views (grid tooltips, compact table)
+            item['derived_stats'] = item.get('derived', {}).get('descriptive_stats', {})
+            _set_frequency_fields(item, full_history)
+
+            commodities.append(item)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Skipping %s: %s", filename, e)
+            continue
+
     # Sort for stable UI display
     commodities.sort(key=lambda x: x.get('name', ''))
     return commodities
@@ -447,18 +539,18 @@ def get_commodity(commodity_id: str) -> Optional[Dict[str, Any]]:
         logger.warning("Path traversal attempt blocked: %s", commodity_id)
         return None
 
-    if os.path.exists(filepath):
-        try:
-            with open(filepath, 'r') as f:
-                item = json.load(f)
-                history = item.get('history', [])
-
-                _hydrate_change_fields(item)
-                _set_previous_observation_fields(item, history)
-                _set_frequency_fields(item, history)
-                
-                return item
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning("Failed to load commodity %s: %s", commodity_id, e)
-            return None
-    return None
+    try:
+        item = load_cached(filepath)
+    except FileNotFoundError:
+        return None
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning("Failed to load commodity %s: %s", commodity_id, e)
+        return None
+
+    history = item.get('history', [])
+
+    _hydrate_change_fields(item)
+    _set_previous_observation_fields(item, history)
+    _set_frequency_fields(item, history)
+
+    return item
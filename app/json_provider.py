@@ -0,0 +1,77 @@
+"""JSON providers for Flask: the app's stdlib provider and an orjson one.
+
+orjson is an optional accelerator (see requirements.txt): create_app installs
+OrjsonProvider when it is importable and JSONProvider otherwise. Both write the
+same JSON, so responses do not depend on whether orjson is installed.
+"""
+from typing import Any, Union
+
+from flask.json.provider import DefaultJSONProvider
+
+from datafiles import nan_to_none
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# The item/key separators orjson writes, by indent: compact, or OPT_INDENT_2.
+_ORJSON_SEPARATORS = {None: (',', ':'), 2: (',', ': ')}
+
+
+class JSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider with the output conventions orjson has built in.
+
+    Non-ASCII text is written unescaped, the default layout is compact (an
+    explicit indent still pretty-prints) and NaN/Infinity become ``null``
+    instead of literals that JSON.parse rejects.
+    """
+
+    ensure_ascii = False
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        kwargs.setdefault('separators', _ORJSON_SEPARATORS.get(kwargs.get('indent')))
+        try:
+            return super().dumps(obj, allow_nan=False, **kwargs)
+        except ValueError:
+            # Non-finite floats: rare, so only then pay for the extra walk.
+            return super().dumps(nan_to_none(obj), **kwargs)
+
+
+class OrjsonProvider(JSONProvider):
+    """JSONProvider that serializes and parses with orjson.
+
+    Keeps Flask's conventions: sorted keys, pretty output when Flask asks for
+    an indent, and DefaultJSONProvider.default for types orjson does not cover
+    (datetimes are passed through so they keep Flask's HTTP-date format).
+    Calls orjson cannot reproduce exactly (other indents or separators, extra
+    json.dumps options) and anything it refuses (e.g. integers beyond 64 bits)
+    are handed to JSONProvider, so the output matches either way. Only the
+    spelling of exponent floats differs (``1e-05`` vs ``1e-5``).
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get('indent')
+        if (
+            indent in _ORJSON_SEPARATORS
+            and kwargs.get('separators', _ORJSON_SEPARATORS[indent]) == _ORJSON_SEPARATORS[indent]
+            and kwargs.keys() <= {'indent', 'separators', 'sort_keys'}
+        ):
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if kwargs.get('sort_keys', self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+            except orjson.JSONEncodeError:
+                pass
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity literals, or genuinely invalid input: let the
+            # stdlib parser accept the former and raise its usual error.
+            return super().loads(s, **kwargs)
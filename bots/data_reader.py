@@ -4,11 +4,50 @@ Shared data access layer for bots - reads from ../data/*.json
 """
 import json
 import os
+import sys
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from datetime import date
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from config import DATA_DIR, CATEGORIES, ALIASES
 
+# The data-file helpers (datafiles.py) live at the project root and are shared
+# with the web app. Appended, not prepended, so bots/config.py still shadows the
+# app's config module when a bot is run from bots/.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+try:
+    from datafiles import data_signature, list_data_files, load_cached  # noqa: E402
+except ImportError:
+    # bots/ deployed on its own (see README): plain, uncached equivalents.
+    def list_data_files(data_dir: str) -> List[Tuple[str, str]]:
+        with os.scandir(data_dir) as entries:
+            return sorted(
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.name.endswith('.json') and entry.name != 'schema.json' and entry.is_file()
+            )
+
+    def data_signature(data_dir: str) -> Tuple[int, int]:
+        try:
+            stamps = [os.stat(path).st_mtime_ns for _name, path in list_data_files(data_dir)]
+        except FileNotFoundError:
+            return 0, 0
+        return len(stamps), max(stamps, default=0)
+
+    def load_cached(path: str) -> Dict:
+        with open(path, 'rb') as f:
+            return json.load(f)
+
+
+# Fixed English month abbreviations for date labels; strftime('%b') would go
+# through the locale machinery for every formatted message.
+MONTH_ABBR = {
+    1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
+    7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec',
+}
+
 
 def _coerce_price(price) -> float:
     """Coerce a possibly null/non-numeric price to a safe float for formatting."""
@@ -62,12 +101,8 @@ def get_commodity_data(commodity_id: str) -> Optional[Dict]:
     if not _is_safe_path(filepath):
         return None
 
-    if not os.path.exists(filepath):
-        return None
-
     try:
-        with open(filepath, 'r') as f:
-            return json.load(f)
+        return load_cached(filepath)
     except (json.JSONDecodeError, IOError):
         return None
 
@@ -80,12 +115,53 @@ _ALL_COMMODITIES_TTL_SECONDS = 30.0
 _all_commodities_cache: Optional[List[Dict]] = None
 _all_commodities_cache_ts: float = 0.0
 
+class _Indexes(NamedTuple):
+    """Ranked movers, per-category buckets and the name index for one data set."""
+
+    signature: Optional[Tuple[int, int]]
+    gainers: List[Dict]
+    losers: List[Dict]
+    by_category: Dict[str, List[Dict]]
+    # Lowercased commodity name -> id, so a name search never has to load
+    # every data file.
+    name_index: Dict[str, str]
+
+
+_EMPTY_INDEXES = _Indexes(None, [], [], {}, {})
+
+# Rebuilt only when the data files change (see datafiles.data_signature) rather
+# than re-sorted on every command. Bot commands read it from worker threads
+# (asyncio.to_thread), so a rebuild never mutates the published indexes: it
+# builds a new _Indexes and rebinds this name in one assignment.
+_INDEXES = _EMPTY_INDEXES
+
 
 def _invalidate_all_commodities_cache() -> None:
-    """Drop the cached commodity list (used by tests)."""
-    global _all_commodities_cache, _all_commodities_cache_ts
+    """Drop the cached commodity list and derived indexes (used by tests)."""
+    global _all_commodities_cache, _all_commodities_cache_ts, _INDEXES
     _all_commodities_cache = None
     _all_commodities_cache_ts = 0.0
+    _INDEXES = _EMPTY_INDEXES
+
+
+def _load_all_commodities() -> List[Dict]:
+    """Load every commodity from DATA_DIR, tagging each with its ``id``."""
+    commodities = []
+
+    try:
+        data_files = list_data_files(DATA_DIR)
+    except FileNotFoundError:
+        data_files = []
+
+    for filename, path in data_files:
+        try:
+            item = load_cached(path)
+            item['id'] = filename[:-5]
+            commodities.append(item)
+        except (json.JSONDecodeError, IOError):
+            continue
+
+    return commodities
 
 
 def get_all_commodities() -> List[Dict]:
@@ -99,42 +175,59 @@ def get_all_commodities() -> List[Dict]:
     ):
         return _all_commodities_cache
 
-    commodities = []
-
-    if not os.path.exists(DATA_DIR):
-        _all_commodities_cache = commodities
-        _all_commodities_cache_ts = now
-        return commodities
-
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json') and filename != 'schema.json':
-            try:
-                with open(os.path.join(DATA_DIR, filename), 'r') as f:
-                    item = json.load(f)
-                    item['id'] = filename.replace('.json', '')
-                    commodities.append(item)
-            except (json.JSONDecodeError, IOError):
-                continue
+    commodities = _load_all_commodities()
 
     _all_commodities_cache = commodities
     _all_commodities_cache_ts = now
     return commodities
 
 
+def _refresh_indexes() -> _Indexes:
+    """Return the indexes for the current data, rebuilding them if it changed."""
+    global _INDEXES
+    indexes = _INDEXES
+    signature = data_signature(DATA_DIR)
+    if indexes.signature == signature:
+        return indexes
+
+    # _load_all_commodities sets each id from its file name; still skip any
+    # record without one rather than fail the shared build for every command.
+    commodities = [c for c in _load_all_commodities() if c.get('id')]
+
+    # Compute the pct once per commodity (decorate-sort-undecorate) instead of
+    # re-deriving it inside the sort key AND twice more in the filters.
+    decorated = sorted(
+        ((_get_change_pct(c), c) for c in commodities),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    gainers = [c for pct, c in decorated if pct > 0]
+    losers = [c for pct, c in decorated if pct < 0][::-1]
+
+    by_id = {c['id']: c for c in commodities}
+    by_category = {
+        category: [by_id[cid] for cid in ids if cid in by_id]
+        for category, ids in CATEGORIES.items()
+    }
+
+    # setdefault keeps the first id (in id order) for a duplicated name. A
+    # null/missing name must not break /top, /prices or /category as well.
+    name_index: Dict[str, str] = {}
+    for c in commodities:
+        name_index.setdefault((c.get('name') or '').lower(), c['id'])
+
+    indexes = _Indexes(signature, gainers, losers, by_category, name_index)
+    _INDEXES = indexes
+    return indexes
+
+
 def get_commodities_by_category(category: str) -> List[Dict]:
     """Get commodities for a specific category."""
     category = category.lower()
     if category not in CATEGORIES:
         return []
 
-    commodities = []
-    for commodity_id in CATEGORIES[category]:
-        data = get_commodity_data(commodity_id)
-        if data:
-            data['id'] = commodity_id
-            commodities.append(data)
-
-    return commodities
+    return list(_refresh_indexes().by_category.get(category, []))
 
 
 def format_price_message(data: Dict, include_link: bool = True) -> str:
@@ -149,9 +242,9 @@ def format_price_message(data: Dict, include_link: bool = True) -> str:
     # Format date
     date_str = data.get('date', '')
     try:
-        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-        formatted_date = date_obj.strftime('%b %d')
-    except ValueError:
+        date_obj = date.fromisoformat(date_str)
+        formatted_date = f"{MONTH_ABBR[date_obj.month]} {date_obj.day:02d}"
+    except (TypeError, ValueError):
         formatted_date = date_str
 
     # Direction emoji
@@ -201,34 +294,19 @@ def _get_change_pct(c: Dict) -> float:
 
 
 def get_top_movers(limit: int = 5) -> Tuple[List[Dict], List[Dict]]:
-    """Get top gainers and losers."""
-    commodities = get_all_commodities()
-
-    # Compute the pct once per commodity (decorate-sort-undecorate) instead of
-    # re-deriving it inside the sort key AND twice more in the filters.
-    decorated = sorted(
-        ((_get_change_pct(c), c) for c in commodities),
-        key=lambda pair: pair[0],
-        reverse=True,
-    )
-
-    gainers = [c for pct, c in decorated if pct > 0][:limit]
-    losers = [c for pct, c in decorated if pct < 0][-limit:][::-1]
-
-    return gainers, losers
+    """Get top gainers and losers from the precomputed ranking."""
+    indexes = _refresh_indexes()
+    return indexes.gainers[:limit], indexes.losers[:limit]
 
 
 def get_available_commodities() -> List[str]:
     """Get list of all available commodity IDs."""
-    if not os.path.exists(DATA_DIR):
+    try:
+        data_files = list_data_files(DATA_DIR)
+    except FileNotFoundError:
         return []
 
-    commodities = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json') and filename != 'schema.json':
-            commodities.append(filename.replace('.json', ''))
-
-    return sorted(commodities)
+    return [filename[:-5] for filename, _path in data_files]
 
 
 def search_commodity(query: str) -> Optional[Dict]:
@@ -244,10 +322,12 @@ def search_commodity(query: str) -> Optional[Dict]:
     if data:
         return data
 
-    # Try partial name match
-    all_commodities = get_all_commodities()
-    for c in all_commodities:
-        if query in c.get('name', '').lower():
-            return c
-
-    return None
+    # Exact, then partial, name match against one snapshot of the name index;
+    # a concurrent rebuild publishes a new dict instead of mutating this one.
+    name_index = _refresh_indexes().name_index
+    commodity_id = name_index.get(query)
+    if commodity_id is None:
+        commodity_id = next((cid for name, cid in name_index.items() if query in name), None)
+    if commodity_id is None:
+        return None
+    return get_commodity_data(commodity_id)
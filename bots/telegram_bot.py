@@ -12,6 +12,10 @@ Commands:
 """
 import asyncio
 import logging
+import signal
+import time
+from html import escape
+from typing import Dict, Optional, Tuple
 from telegram import Update
 from telegram.ext import Application, CommandHandler, ContextTypes
 from telegram.constants import ParseMode
@@ -37,23 +41,103 @@ logger = logging.getLogger(__name__)
 
 TELEGRAM_MESSAGE_LIMIT = 4096
 DATA_READ_TIMEOUT = 10  # seconds
+# getUpdates long-poll window: Telegram holds the request open until an update
+# arrives or this many seconds pass, so an idle bot makes ~2 calls a minute.
+LONG_POLL_TIMEOUT = 30  # seconds
 
 
-def get_footer() -> str:
-    """Standard footer with website link."""
-    return f"\n\n📊 [benchmarkwatcher.online]({WEBSITE_URL})"
+# Static replies depend only on config, so they are rendered once at import
+# instead of on every command.
+FOOTER = f"\n\n📊 [benchmarkwatcher.online]({WEBSITE_URL})"
+CATEGORY_EMOJI = {'energy': '🛢️', 'precious': '🥇', 'metals': '⛏️', 'agriculture': '🌾'}
+CATEGORIES_LIST = ', '.join(CATEGORIES.keys())
+
+# /help and /list are sent with ParseMode.HTML: explicit tags leave nothing for
+# Telegram's Markdown parser to disambiguate, and the texts are fixed bytes.
+FOOTER_HTML = f'\n\n📊 <a href="{escape(WEBSITE_URL)}">benchmarkwatcher.online</a>'
+
+HELP_TEXT = f"""
+🛢️ <b>{escape(BOT_NAME)}</b>
+
+Get latest available commodity benchmark prices.
+
+<b>Commands:</b>
+• <code>/price &lt;commodity&gt;</code> - Get a commodity price
+  Example: <code>/price brent</code> or <code>/price gold</code>
+
+• <code>/prices &lt;category&gt;</code> - Get all prices in a category
+  Categories: <code>energy</code>, <code>precious</code>, <code>metals</code>, <code>agriculture</code>
+
+• <code>/top</code> - Show top gainers and losers
+
+• <code>/list</code> - Show all available commodities
+
+<b>Quick examples:</b>
+<code>/price oil</code> → Brent Crude price
+<code>/price gold</code> → Gold price
+<code>/prices energy</code> → All energy commodities
+{FOOTER_HTML}
+"""
+
+PRICES_USAGE_TEXT = (
+    f"⚠️ Please specify a category.\n\n"
+    f"Available: `{CATEGORIES_LIST}`\n\n"
+    f"Example: `/prices energy`"
+)
+
+
+def _build_list_text() -> str:
+    """Render the /list reply (HTML) from CATEGORIES."""
+    lines = ["📋 <b>Available Commodities</b>", ""]
+
+    for category, commodities in CATEGORIES.items():
+        emoji = CATEGORY_EMOJI.get(category, '📊')
+        names = escape(', '.join([c.replace('_', ' ').title() for c in commodities[:5]]))
+        more = f" +{len(commodities) - 5} more" if len(commodities) > 5 else ""
+        lines.append(f"{emoji} <b>{escape(category.title())}:</b> {names}{more}")
+
+    lines.append("")
+    lines.append("Use <code>/price &lt;name&gt;</code> to get prices.")
+    return "\n".join(lines) + FOOTER_HTML
+
+
+LIST_TEXT = _build_list_text()
+
+
+# Rendered /price, /prices and /top replies keyed by (command, argument). The
+# data changes at most once a day, so a short TTL collapses bursts of identical
+# commands into one data read + format. Cleared wholesale if it grows large
+# (arbitrary /price queries are user input).
+RESPONSE_CACHE_TTL = 60  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 256
+_RESPONSE_CACHE: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+
+def get_cached_response(key: Tuple[str, str]) -> Optional[str]:
+    """Return a rendered reply if one was stored less than the TTL ago."""
+    hit = _RESPONSE_CACHE.get(key)
+    if hit is not None and time.monotonic() - hit[0] < RESPONSE_CACHE_TTL:
+        return hit[1]
+    return None
+
+
+def store_response(key: Tuple[str, str], msg: str) -> str:
+    """Remember a rendered reply and return it."""
+    if len(_RESPONSE_CACHE) >= RESPONSE_CACHE_MAX_ENTRIES:
+        _RESPONSE_CACHE.clear()
+    _RESPONSE_CACHE[key] = (time.monotonic(), msg)
+    return msg
 
 
 def truncate_message(msg: str, limit: int = TELEGRAM_MESSAGE_LIMIT) -> str:
     """Truncate message to fit Telegram's character limit, preserving the footer."""
     if len(msg) <= limit:
         return msg
-    footer = get_footer()
     ellipsis = "\n\n… _truncated_"
-    max_body = limit - len(footer) - len(ellipsis)
+    max_body = limit - len(FOOTER) - len(ellipsis)
     # Cut at last full line within limit
     cut = msg[:max_body].rsplit('\n', 1)[0]
-    return cut + ellipsis + footer
+    return cut + ellipsis + FOOTER
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -63,29 +147,7 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /help command."""
-    help_text = f"""
-🛢️ **{BOT_NAME}**
-
-Get latest available commodity benchmark prices.
-
-**Commands:**
-• `/price <commodity>` - Get a commodity price
-  Example: `/price brent` or `/price gold`
-
-• `/prices <category>` - Get all prices in a category
-  Categories: `energy`, `precious`, `metals`, `agriculture`
-
-• `/top` - Show top gainers and losers
-
-• `/list` - Show all available commodities
-
-**Quick examples:**
-`/price oil` → Brent Crude price
-`/price gold` → Gold price
-`/prices energy` → All energy commodities
-{get_footer()}
-"""
-    await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+    await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
 
 async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -98,6 +160,12 @@ async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         return
     
     query = ' '.join(context.args)
+    cache_key = ('price', query.lower().strip())
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        await update.message.reply_text(cached, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+        return
+
     # Run blocking I/O in thread with timeout to avoid hanging
     try:
         data = await asyncio.wait_for(
@@ -127,8 +195,7 @@ async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         )
         return
     
-    msg = format_price_message(data)
-    msg += get_footer()
+    msg = store_response(cache_key, format_price_message(data) + FOOTER)
     
     await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
 
@@ -136,26 +203,25 @@ async def price_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 async def prices_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /prices <category> command."""
     if not context.args:
-        categories = ', '.join(CATEGORIES.keys())
-        await update.message.reply_text(
-            f"⚠️ Please specify a category.\n\n"
-            f"Available: `{categories}`\n\n"
-            f"Example: `/prices energy`",
-            parse_mode=ParseMode.MARKDOWN
-        )
+        await update.message.reply_text(PRICES_USAGE_TEXT, parse_mode=ParseMode.MARKDOWN)
         return
     
     category = context.args[0].lower()
     
     if category not in CATEGORIES:
-        categories = ', '.join(CATEGORIES.keys())
         await update.message.reply_text(
             f"❓ Unknown category '{category}'.\n\n"
-            f"Available: `{categories}`",
+            f"Available: `{CATEGORIES_LIST}`",
             parse_mode=ParseMode.MARKDOWN
         )
         return
-    
+
+    cache_key = ('prices', category)
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        await update.message.reply_text(cached, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+        return
+
     try:
         commodities = await asyncio.wait_for(
             asyncio.to_thread(get_commodities_by_category, category),
@@ -173,20 +239,23 @@ async def prices_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
     
     # Format response
-    emoji_map = {'energy': '🛢️', 'precious': '🥇', 'metals': '⛏️', 'agriculture': '🌾'}
-    emoji = emoji_map.get(category, '📊')
+    emoji = CATEGORY_EMOJI.get(category, '📊')
     
-    msg = f"{emoji} **{category.title()} Commodities**\n\n"
-    for c in commodities:
-        msg += format_compact_price(c) + "\n"
-
-    msg += get_footer()
+    lines = [f"{emoji} **{category.title()} Commodities**", ""]
+    lines.extend(format_compact_price(c) for c in commodities)
+    msg = store_response(cache_key, truncate_message("\n".join(lines) + "\n" + FOOTER))
 
-    await update.message.reply_text(truncate_message(msg), parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+    await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
 
 
 async def top_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /top command - show top movers."""
+    cache_key = ('top', '')
+    cached = get_cached_response(cache_key)
+    if cached is not None:
+        await update.message.reply_text(cached, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+        return
+
     try:
         gainers, losers = await asyncio.wait_for(
             asyncio.to_thread(get_top_movers, 5),
@@ -199,42 +268,26 @@ async def top_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         )
         return
     
-    msg = "📈 **Top Gainers**\n"
+    lines = ["📈 **Top Gainers**"]
     if gainers:
-        for i, c in enumerate(gainers, 1):
-            msg += f"{i}. {format_compact_price(c)}\n"
+        lines.extend(f"{i}. {format_compact_price(c)}" for i, c in enumerate(gainers, 1))
     else:
-        msg += "No gainers today.\n"
-    
-    msg += "\n📉 **Top Losers**\n"
+        lines.append("No gainers today.")
+
+    lines.extend(["", "📉 **Top Losers**"])
     if losers:
-        for i, c in enumerate(losers, 1):
-            msg += f"{i}. {format_compact_price(c)}\n"
+        lines.extend(f"{i}. {format_compact_price(c)}" for i, c in enumerate(losers, 1))
     else:
-        msg += "No losers today.\n"
-    
-    msg += get_footer()
+        lines.append("No losers today.")
+
+    msg = store_response(cache_key, "\n".join(lines) + "\n" + FOOTER)
     
     await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
 
 
 async def list_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /list command - show all available commodities."""
-    msg = "📋 **Available Commodities**\n\n"
-    
-    for category, commodities in CATEGORIES.items():
-        emoji_map = {'energy': '🛢️', 'precious': '🥇', 'metals': '⛏️', 'agriculture': '🌾'}
-        emoji = emoji_map.get(category, '📊')
-        msg += f"{emoji} **{category.title()}:** "
-        msg += ', '.join([c.replace('_', ' ').title() for c in commodities[:5]])
-        if len(commodities) > 5:
-            msg += f" +{len(commodities) - 5} more"
-        msg += "\n"
-    
-    msg += "\nUse `/price <name>` to get prices."
-    msg += get_footer()
-    
-    await update.message.reply_text(msg, parse_mode=ParseMode.MARKDOWN, disable_web_page_preview=True)
+    await update.message.reply_text(LIST_TEXT, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
 
 
 async def error_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -288,13 +341,25 @@ async def run_bot() -> None:
     
     async with app:
         await app.start()
-        await app.updater.start_polling(allowed_updates=Update.ALL_TYPES)
-        
-        # Keep running until interrupted
-        import asyncio
+        await app.updater.start_polling(
+            poll_interval=0.0,
+            timeout=LONG_POLL_TIMEOUT,
+            # Only commands are handled, so skip edits, channel posts, etc.
+            allowed_updates=[Update.MESSAGE],
+        )
+
+        # Park until SIGINT/SIGTERM instead of waking the loop every second
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Windows loops lack signal handlers; Ctrl+C still cancels
+                # asyncio.run(), which lands in the CancelledError below.
+                pass
         try:
-            while True:
-                await asyncio.sleep(1)
+            await stop_event.wait()
         except asyncio.CancelledError:
             pass
         finally:
@@ -310,7 +375,6 @@ def main() -> None:
         print("2. Create .env file with: TELEGRAM_BOT_TOKEN=your_token")
         return
     
-    import asyncio
     asyncio.run(run_bot())
 
 
@@ -0,0 +1,165 @@
+"""Helpers for the commodity JSON files in data/.
+
+Shared by the web app (app.data_handler), the chat bots (bots/data_reader.py)
+and the fetch scripts, so every reader lists, parses and caches the data files
+the same way, and both JSON writers agree on non-finite floats.
+"""
+import json
+import math
+import os
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+__all__ = [
+    'IGNORED_FILES',
+    'is_data_file',
+    'list_data_files',
+    'data_signature',
+    'parse_json',
+    'cached_parse',
+    'load_cached',
+    'nan_to_none',
+    'bisect_date',
+]
+
+# JSON files in the data directory that are not commodity records.
+IGNORED_FILES = frozenset({'schema.json'})
+
+
+def is_data_file(name: str) -> bool:
+    """True for a commodity data file name (``*.json`` minus the ignored set)."""
+    return name[-5:] == '.json' and name not in IGNORED_FILES
+
+
+# Data-file listing per directory, keyed on the directory's st_mtime_ns. Adding,
+# removing or atomically replacing (os.replace) a file bumps it, so the listing
+# is only rebuilt when the set of files can actually have changed.
+_DIRLIST_CACHE: Dict[str, Tuple[int, List[Tuple[str, str]]]] = {}
+
+
+def list_data_files(data_dir: str) -> List[Tuple[str, str]]:
+    """Return ``(filename, path)`` for every data file in *data_dir*, by name.
+
+    Raises FileNotFoundError if the directory does not exist. The returned
+    list is shared between callers and must not be modified.
+    """
+    mtime = os.stat(data_dir).st_mtime_ns
+    hit = _DIRLIST_CACHE.get(data_dir)
+    if hit is None or hit[0] != mtime:
+        with os.scandir(data_dir) as entries:
+            files = sorted(
+                (entry.name, entry.path)
+                for entry in entries
+                if is_data_file(entry.name) and entry.is_file()
+            )
+        hit = (mtime, files)
+        _DIRLIST_CACHE[data_dir] = hit
+    return hit[1]
+
+
+def data_signature(data_dir: str) -> Tuple[int, int]:
+    """Return ``(file count, newest st_mtime_ns)`` over the data files.
+
+    One scandir pass with no parsing. Unlike the directory mtime this also
+    catches a file rewritten in place. A missing directory is ``(0, 0)``.
+    """
+    count = 0
+    newest = 0
+    try:
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                if is_data_file(entry.name) and entry.is_file():
+                    count += 1
+                    newest = max(newest, entry.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return count, newest
+
+
+def parse_json(raw: Union[bytes, str]) -> Any:
+    """Parse JSON bytes/str, with orjson when installed.
+
+    orjson rejects the NaN/Infinity literals stdlib json writes by default, so
+    anything it refuses is retried with stdlib json (which raises as usual if
+    the input really is invalid).
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+# Parsed data files keyed by path. Each entry carries the (st_mtime_ns, st_size)
+# it was parsed at, so a file rewritten by the fetcher is re-read on next access
+# while unchanged files skip the parse entirely. Entries are read-only views
+# shared by every caller (see load_cached).
+_JSON_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+
+
+def cached_parse(path: str) -> Mapping[str, Any]:
+    """Return the shared, read-only parse of a JSON data file.
+
+    The file is re-read only when its mtime or size changed.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _JSON_CACHE.get(path)
+    if hit is None or hit[0] != stamp:
+        with open(path, 'rb') as f:
+            hit = (stamp, MappingProxyType(parse_json(f.read())))
+        _JSON_CACHE[path] = hit
+    return hit[1]
+
+
+def load_cached(path: str) -> Dict[str, Any]:
+    """Load a JSON data file, reusing the previous parse while it is unchanged.
+
+    Returns a shallow copy: callers may set top-level fields (``id``, change,
+    history window, ...), but nested values such as ``history`` stay shared
+    with the cache entry and must be treated as read-only.
+    """
+    return dict(cached_parse(path))
+
+
+def nan_to_none(obj: Any) -> Any:
+    """Return *obj* with every NaN/Infinity float (at any depth) replaced by None.
+
+    orjson always writes non-finite floats as ``null``; stdlib json writes the
+    non-standard ``NaN``/``Infinity`` literals. The stdlib fallbacks run their
+    input through this so both paths emit the same JSON.
+    """
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: nan_to_none(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [nan_to_none(value) for value in obj]
+    return obj
+
+
+def bisect_date(entries: Sequence[Mapping[str, Any]], day: str) -> int:
+    """Return the index of the first entry dated on or after *day*.
+
+    *entries* must be sorted ascending by their ISO ``date``. Entries with a
+    missing or null date are stepped over rather than compared, so they may
+    sit anywhere (callers drop them). Equivalent to ``bisect_left`` with a
+    date key, which needs Python 3.10.
+    """
+    lo, hi = 0, len(entries)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        probe = mid
+        while probe < hi and not entries[probe].get('date'):
+            probe += 1
+        if probe < hi and entries[probe]['date'] < day:
+            lo = probe + 1
+        else:
+            hi = mid
+    return lo
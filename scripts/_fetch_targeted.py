@@ -2,7 +2,6 @@
 """Targeted fetcher: only updates specified commodity IDs."""
 import os
 import sys
-import json
 import logging
 
 from dotenv import load_dotenv
@@ -11,19 +10,17 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 load_dotenv(os.path.join(PROJECT_ROOT, '.env'))
 
+from scripts.fetch_daily_data import FETCH_ADAPTERS
 from scripts.fetchers import FETCHER_REGISTRY
 from scripts.fetchers._shared import (
     merge_history,
     compute_metrics,
     save_atomic,
     build_commodity_record,
+    loads_json,
 )
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%H:%M:%S'
-)
+# Logging is configured by fetch_daily_data on import.
 logger = logging.getLogger(__name__)
 
 TARGET_IDS = {
@@ -36,8 +33,20 @@ TARGET_IDS = {
 CONFIG_PATH = os.path.join(PROJECT_ROOT, 'scripts', 'commodities.json')
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
 
-with open(CONFIG_PATH) as f:
-    config = json.load(f)
+
+def _fetch_usda(fetcher, conf):
+    return fetcher(
+        commodity_desc=conf.get('commodity_desc'),
+        unit_desc=conf.get('unit_desc', '$ / BU'),
+        year_start=conf.get('year_start', 2020),
+    )
+
+
+# The daily fetcher's adapters, except that USDA backfills from year_start.
+TARGETED_ADAPTERS = {**FETCH_ADAPTERS, 'USDA': _fetch_usda}
+
+with open(CONFIG_PATH, 'rb') as f:
+    config = loads_json(f.read())
 
 for commodity in config:
     cid = commodity.get('id', '')
@@ -52,19 +61,14 @@ for commodity in config:
         logger.warning(f'No fetcher for source_type={source_type!r} ({cid})')
         continue
 
+    adapter = TARGETED_ADAPTERS.get(source_type)
+    if not adapter:
+        logger.warning(f'Unhandled source_type={source_type!r} ({cid}), skipping')
+        continue
+
     logger.info(f'Updating {commodity["name"]}...')
     try:
-        if source_type == 'YAHOO':
-            new_rows = fetcher(conf.get('symbol'))
-        elif source_type == 'USDA':
-            new_rows = fetcher(
-                commodity_desc=conf.get('commodity_desc'),
-                unit_desc=conf.get('unit_desc', '$ / BU'),
-                year_start=conf.get('year_start', 2020),
-            )
-        else:
-            logger.warning(f'  Unhandled source_type {source_type!r}, skipping')
-            continue
+        new_rows = adapter(fetcher, conf)
 
         if not new_rows:
             logger.warning(f'  FAILED: No data returned for {cid}')
@@ -72,8 +76,8 @@ for commodity in config:
 
         fp = os.path.join(DATA_DIR, f'{cid}.json')
         if os.path.exists(fp):
-            with open(fp) as f:
-                existing = json.load(f)
+            with open(fp, 'rb') as f:
+                existing = loads_json(f.read())
         else:
             existing = {}
         merged = merge_history(existing.get('history', []), new_rows)
@@ -14,6 +14,9 @@ import os
 import sys
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
@@ -32,6 +35,7 @@ from scripts.fetchers._shared import (
     compute_metrics,
     save_atomic,
     build_commodity_record,
+    loads_json,
 )
 
 # Re-export for backward compatibility (tests import from here)
@@ -40,7 +44,7 @@ __all__ = ['compute_metrics', 'merge_history', 'main']
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
+    format='%(asctime)s [%(levelname)s] %(threadName)s %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 logger = logging.getLogger(__name__)
@@ -50,11 +54,17 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(SCRIPT_DIR, '..', 'data')
 CONFIG_PATH = os.path.join(SCRIPT_DIR, 'commodities.json')
 
+# Commodities are fetched concurrently: each update is dominated by an HTTP
+# round-trip, and every commodity writes its own data file. Each source gets
+# its own pool so one rate-limited host (FRED allows ~120 req/min) cannot
+# tie up the workers the other sources need.
+MAX_WORKERS_PER_SOURCE = 8
+
 
 def load_config() -> List[Dict[str, Any]]:
     """Load commodity configuration from commodities.json."""
-    with open(CONFIG_PATH, 'r') as f:
-        config = json.load(f)
+    with open(CONFIG_PATH, 'rb') as f:
+        config = loads_json(f.read())
     logger.info(f"Loaded {len(config)} commodities from {os.path.basename(CONFIG_PATH)}")
     return config
 
@@ -100,36 +110,48 @@ def fetch_new_data(commodity: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
     fetcher = FETCHER_REGISTRY.get(source_type)
 
     if not fetcher:
-        logger.warning(f"  No fetcher for source_type '{source_type}'")
+        logger.warning(f"  [{commodity.get('id', '?')}] No fetcher for source_type '{source_type}'")
         return None
 
     adapter = FETCH_ADAPTERS.get(source_type, _fetch_default)
     return adapter(fetcher, conf)
 
 
-def update_commodity(commodity: Dict[str, Any]) -> bool:
-    """Orchestrates the update process for a single commodity. Returns True on success."""
-    logger.info(f"Updating {commodity['name']}...")
+def _same_content(existing: Dict[str, Any], record: Dict[str, Any]) -> bool:
+    """True if ``record`` differs from ``existing`` only in ``updated_at``."""
+    if existing.keys() != record.keys():
+        return False
+    return all(existing[key] == value for key, value in record.items() if key != 'updated_at')
+
+
+def update_commodity(commodity: Dict[str, Any], updated_at: Optional[str] = None) -> bool:
+    """Orchestrates the update process for a single commodity. Returns True on success.
+
+    ``updated_at`` is the run's timestamp (see main); defaults to now.
+    """
+    logger.info(f"[{commodity['id']}] Updating {commodity['name']}...")
 
     # 1. Load Existing
     filepath = os.path.join(DATA_DIR, f"{commodity['id']}.json")
     existing_history = []
+    existing_record: Dict[str, Any] = {}
     if os.path.exists(filepath):
         try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
-                # Purge simulated data if present
-                if not data.get('simulated', False):
-                    existing_history = data.get('history', [])
+            with open(filepath, 'rb') as f:
+                data = loads_json(f.read())
+            # Purge simulated data if present
+            if not data.get('simulated', False):
+                existing_history = data.get('history', [])
+                existing_record = data
         except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"  Could not read existing data for {commodity['name']}: {e}")
+            logger.warning(f"  [{commodity['id']}] Could not read existing data: {e}")
             # Continue with empty history — new fetch will start fresh
 
     # 2. Fetch New Data
     new_data = fetch_new_data(commodity)
 
     if not new_data:
-        logger.warning(f"  FAILED: No data fetched for {commodity['name']}")
+        logger.warning(f"  [{commodity['id']}] FAILED: No data fetched")
         return False
 
     # 3. Merge & Process
@@ -157,14 +179,20 @@ def update_commodity(commodity: Dict[str, Any]) -> bool:
         "simulated": False,
     }
     record = build_commodity_record(
-        {}, history, metrics, overrides=config_fields
+        {}, history, metrics, overrides=config_fields, updated_at=updated_at
     )
 
+    # Monthly/weekly series usually come back unchanged: leave the file (and
+    # its mtime, which the app and bot caches key on) alone in that case.
+    if _same_content(existing_record, record):
+        logger.info(f"  [{commodity['id']}] Unchanged: {len(history)} records, skipping write.")
+        return True
+
     if save_atomic(filepath, record):
-        logger.info(f"  Success: {len(history)} records saved.")
+        logger.info(f"  [{commodity['id']}] Success: {len(history)} records saved.")
         return True
     else:
-        logger.error(f"  FAILED: Could not save {commodity['name']}")
+        logger.error(f"  [{commodity['id']}] FAILED: Could not save {filepath}")
         return False
 
 
@@ -173,18 +201,37 @@ def main():
     os.makedirs(DATA_DIR, exist_ok=True)
 
     config = load_config()
+    # One timestamp for the whole run: every file written by it agrees.
+    updated_at = datetime.now().isoformat()
+
+    by_source: Dict[str, List[Dict[str, Any]]] = {}
+    for commodity in config:
+        by_source.setdefault(commodity.get('source_type', ''), []).append(commodity)
 
     success = 0
     fail = 0
-    for commodity in config:
-        try:
-            if update_commodity(commodity):
-                success += 1
-            else:
+    with ExitStack() as stack:
+        futures = {}
+        for source, commodities in by_source.items():
+            # Threads are named after their source (shown in the log format),
+            # so a fetcher's error line can be told apart from the other pools'.
+            executor = stack.enter_context(
+                ThreadPoolExecutor(
+                    max_workers=min(MAX_WORKERS_PER_SOURCE, len(commodities)),
+                    thread_name_prefix=f"fetch-{source or 'default'}",
+                )
+            )
+            for commodity in commodities:
+                futures[executor.submit(update_commodity, commodity, updated_at)] = commodity
+        for future in as_completed(futures):
+            try:
+                if future.result():
+                    success += 1
+                else:
+                    fail += 1
+            except Exception as e:
+                logger.error(f"  [{futures[future].get('id', '?')}] Exception while updating: {e}")
                 fail += 1
-        except Exception as e:
-            logger.error(f"  Exception updating {commodity.get('name', '?')}: {e}")
-            fail += 1
 
     logger.info(f"\n{'=' * 50}")
     logger.info(f"Fetch complete: {success} success, {fail} failed, {len(config)} total")
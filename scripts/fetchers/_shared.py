@@ -1,21 +1,35 @@
 """
 Shared utilities for all fetchers.
 - SmartDateParser: stateful date format optimizer
-- safe_get: HTTP GET with retry + backoff
+- safe_get: HTTP GET with retry + jittered backoff
 - merge_history: deduplicated date-sorted merge
 - compute_metrics: backward-looking observation-based stats
 - save_atomic: crash-safe JSON write
+- loads_json / dumps_json: JSON codec (orjson when installed; loads_json is
+  datafiles.parse_json, shared with the app and bots)
 """
 
 import os
+import re
 import json
-import time
+import inspect
 import logging
+import stat
 import tempfile
 from datetime import datetime, date
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from datafiles import bisect_date, nan_to_none, parse_json as loads_json
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -28,49 +42,91 @@ ParamsType = Union[Dict[str, Any], Sequence[Tuple[str, Any]], None]
 # SmartDateParser
 # =============================================================================
 
+# YYYY-MM-DD with an optional 'T'/space HH:MM:SS suffix: what FRED, EIA and
+# USDA send for nearly every record. re.ASCII: strptime only takes ASCII
+# digits, while a bare \d would also let e.g. Arabic-Indic digits through.
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}):(\d{2}))?', re.ASCII)
+
+# Accepted formats in probe order, each gated by a regex of the shapes strptime
+# would accept for it (1-2 ASCII digit fields, any whitespace for a space), so
+# only plausible formats pay for a strptime call and its exception on failure.
+_D = r'[0-9]{1,2}'
+_DATE_FORMATS: Dict[str, re.Pattern] = {
+    fmt: re.compile(pattern, re.IGNORECASE)
+    for fmt, pattern in (
+        ('%Y-%m-%d', rf'[0-9]{{4}}-{_D}-{_D}'),                           # ISO default
+        ('%Y-%m-%dT%H:%M:%S', rf'[0-9]{{4}}-{_D}-{_D}T{_D}:{_D}:{_D}'),   # ISO-T
+        ('%m/%d/%Y', rf'{_D}/{_D}/[0-9]{{4}}'),                           # US
+        ('%d/%m/%Y', rf'{_D}/{_D}/[0-9]{{4}}'),                           # EU
+        ('%Y-%m-%d %H:%M:%S', rf'[0-9]{{4}}-{_D}-{_D}\s+{_D}:{_D}:{_D}'), # Space Time
+        ('%Y/%m/%d', rf'[0-9]{{4}}/{_D}/{_D}'),                           # Slashes
+        ('%Y%m%d', r'[0-9]{6,8}'),                                        # Compact
+    )
+}
+
+
 class SmartDateParser:
     """
     Stateful parser that optimizes date parsing by 'remembering'
     the last successful format. This speeds up processing by ~7x.
+
+    ISO dates skip strptime entirely via a precompiled regex; other inputs
+    only reach strptime for formats whose regex they match.
     """
 
     def __init__(self):
         self._last_working_fmt = None
-        self._formats = [
-            '%Y-%m-%d',          # ISO default
-            '%Y-%m-%dT%H:%M:%S', # ISO-T
-            '%m/%d/%Y',          # US
-            '%d/%m/%Y',          # EU
-            '%Y-%m-%d %H:%M:%S', # Space Time
-            '%Y/%m/%d',          # Slashes
-            '%Y%m%d',            # Compact
-        ]
+        self._formats = _DATE_FORMATS
 
     def parse(self, date_str: str) -> Optional[str]:
         """Parse a date string into YYYY-MM-DD format."""
         if not date_str:
             return None
+        if not isinstance(date_str, str):
+            logger.warning(f"  Could not parse date: {date_str}")
+            return None
+
+        text = date_str[:19]
+
+        # ISO fast path: the input already is YYYY-MM-DD, it only needs checking
+        m = _ISO_DATE_RE.fullmatch(text)
+        if m and self._valid_iso(m):
+            return date_str[:10]
 
         # Fast path: try the last format that worked
-        if self._last_working_fmt:
+        last = self._last_working_fmt
+        if last and self._formats[last].fullmatch(text):
             try:
-                dt = datetime.strptime(date_str[:19], self._last_working_fmt)
-                return dt.strftime('%Y-%m-%d')
-            except (ValueError, TypeError):
+                return datetime.strptime(text, last).date().isoformat()
+            except ValueError:
                 pass
 
-        # Slow path: try all formats
-        for fmt in self._formats:
+        # Slow path: try every format whose shape matches
+        for fmt, pattern in self._formats.items():
+            if not pattern.fullmatch(text):
+                continue
             try:
-                dt = datetime.strptime(date_str[:19], fmt)
-                self._last_working_fmt = fmt
-                return dt.strftime('%Y-%m-%d')
-            except (ValueError, TypeError):
+                dt = datetime.strptime(text, fmt)
+            except ValueError:
                 continue
+            self._last_working_fmt = fmt
+            return dt.date().isoformat()
 
         logger.warning(f"  Could not parse date: {date_str}")
         return None
 
+    @staticmethod
+    def _valid_iso(m: re.Match) -> bool:
+        """Apply the range checks strptime would, without calling it."""
+        try:
+            date(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            return False
+        if m[4] is None:
+            return True
+        # strptime's %S accepts leap seconds up to 61
+        return int(m[4]) < 24 and int(m[5]) < 60 and int(m[6]) <= 61
+
 
 # =============================================================================
 # HTTP Helper
@@ -80,17 +136,55 @@ class SmartDateParser:
 # misbehaving/hostile upstream (10 MB is far above any real fetcher payload).
 MAX_RESPONSE_BYTES = 10 * 1024 * 1024
 
+# Transient failures (connection errors, 429 and 5xx) are retried by urllib3
+# inside the adapter: exponential backoff with jitter, so parallel workers do
+# not retry in lockstep, and Retry-After from a rate-limiting host is honoured.
+# Once retries are exhausted the last response is returned and raise_for_status
+# surfaces it. Only GET is ever retried: safe_get is the sole caller.
+_RETRY_OPTIONS: Dict[str, Any] = {
+    'total': 3,
+    'allowed_methods': frozenset({'GET'}),
+    'backoff_factor': 1.5,
+    'status_forcelist': (429, 500, 502, 503, 504),
+    'respect_retry_after_header': True,
+    'raise_on_status': False,
+}
+
+
+def _build_retry(retry_cls: Callable[..., Retry] = Retry) -> Retry:
+    """Build the Retry policy with the keywords this urllib3 version takes.
+
+    ``backoff_jitter`` only exists from urllib3 2.0, and ``allowed_methods``
+    was called ``method_whitelist`` before 1.26.
+    """
+    options = dict(_RETRY_OPTIONS)
+    accepted = inspect.signature(retry_cls).parameters
+    if 'allowed_methods' not in accepted:
+        options['method_whitelist'] = options.pop('allowed_methods')
+    if 'backoff_jitter' in accepted:
+        options['backoff_jitter'] = 1.0
+    return retry_cls(**options)
+
+
+_RETRY = _build_retry()
+
 # Module-level Session: connection pooling + keep-alive across the many GETs a
-# fetch run makes to the same hosts (FRED/EIA/USDA/Yahoo).
+# fetch run makes to the same hosts (FRED/EIA/USDA/Yahoo). The adapter keeps a
+# pool per host (a handful of hosts) with room for concurrent fetches to each
+# one.
 _SESSION = requests.Session()
 _SESSION.headers.update(
     {'User-Agent': 'BenchmarkWatcher/1.0 (open-source commodity tracker)'}
 )
+_ADAPTER = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_RETRY)
+_SESSION.mount('https://', _ADAPTER)
+_SESSION.mount('http://', _ADAPTER)
 
 
-def safe_get(url: str, params: ParamsType = None, retries: int = 3) -> requests.Response:
+def safe_get(url: str, params: ParamsType = None) -> requests.Response:
     """
-    Robust HTTP GET with exponential backoff and proper User-Agent.
+    HTTP GET with retry + jittered backoff (via the session's adapter) and a
+    proper User-Agent.
 
     ``params`` accepts a dict **or** a sequence of (key, value) tuples
     so callers like EIA can send repeated query-string keys.
@@ -98,31 +192,23 @@ def safe_get(url: str, params: ParamsType = None, retries: int = 3) -> requests.
     Uses a shared pooled ``Session`` and streams the body so an oversized
     response can be rejected before it is fully buffered into memory.
     """
-    for attempt in range(retries):
-        try:
-            resp = _SESSION.get(url, params=params, timeout=30, stream=True)
-            resp.raise_for_status()
-            # Guard against an unbounded body: prefer the declared length, then
-            # fall back to measuring the streamed content.
-            declared = resp.headers.get('Content-Length')
-            if declared is not None and declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
-                resp.close()
-                raise requests.exceptions.RequestException(
-                    f"Response too large: {declared} bytes > {MAX_RESPONSE_BYTES}"
-                )
-            content = resp.content  # buffers the streamed body
-            if len(content) > MAX_RESPONSE_BYTES:
-                resp.close()
-                raise requests.exceptions.RequestException(
-                    f"Response too large: {len(content)} bytes > {MAX_RESPONSE_BYTES}"
-                )
-            return resp
-        except requests.exceptions.RequestException as e:
-            if attempt == retries - 1:
-                raise
-            sleep_time = 1.5 * (2 ** attempt)
-            logger.warning(f"  Retry {attempt + 1}/{retries} in {sleep_time}s: {e}")
-            time.sleep(sleep_time)
+    resp = _SESSION.get(url, params=params, timeout=30, stream=True)
+    resp.raise_for_status()
+    # Guard against an unbounded body: prefer the declared length, then
+    # fall back to measuring the streamed content.
+    declared = resp.headers.get('Content-Length')
+    if declared is not None and declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+        resp.close()
+        raise requests.exceptions.RequestException(
+            f"Response too large: {declared} bytes > {MAX_RESPONSE_BYTES}"
+        )
+    content = resp.content  # buffers the streamed body
+    if len(content) > MAX_RESPONSE_BYTES:
+        resp.close()
+        raise requests.exceptions.RequestException(
+            f"Response too large: {len(content)} bytes > {MAX_RESPONSE_BYTES}"
+        )
+    return resp
 
 
 # =============================================================================
@@ -158,29 +244,73 @@ def parse_records(
     return list(reversed(results))
 
 
+def _dated(entries: List[Observation], label: str) -> List[Observation]:
+    """Drop (and log) observations with a missing/empty ``date``."""
+    dated: List[Observation] = []
+    for entry in entries:
+        if not entry.get('date'):
+            logger.warning("  Skipping %s observation with missing date: %s", label, entry)
+            continue
+        dated.append(entry)
+    return dated
+
+
+def _is_strictly_ascending(entries: List[Observation]) -> bool:
+    """True if dates increase entry to entry (sorted, no repeated date)."""
+    return all(a['date'] < b['date'] for a, b in zip(entries, entries[1:]))
+
+
 def merge_history(existing: List[Observation], new_data: List[Observation]) -> List[Observation]:
     """Merge new data into existing history (deduplicated by date).
 
     Observations missing/empty a ``date`` are skipped and logged rather than
     bucketed under the empty-string key (which would collapse every dateless
     entry to a single record).
+
+    Both inputs are normally already date-sorted without duplicates, so they
+    are combined with a single two-pointer pass; anything else goes through
+    the dict-dedup-and-sort fallback. Either way new data wins a date tie.
+    Checking the inputs (dates present, strictly ascending) is still linear
+    in the existing history; only the merge loop is not: history older than
+    the first new date is copied as one slice, so a daily update that only
+    appends (or revises the tail) steps through just the new rows.
     """
+    old = _dated(existing, 'existing')
+    new = _dated(new_data, 'new')
+    if not (_is_strictly_ascending(old) and _is_strictly_ascending(new)):
+        return _merge_unsorted(old, new)
+    if not new:
+        return old
+
+    i = bisect_date(old, new[0]['date'])
+    merged: List[Observation] = old[:i]
+    j = 0
+    while i < len(old) and j < len(new):
+        old_date = old[i]['date']
+        new_date = new[j]['date']
+        if old_date < new_date:
+            merged.append(old[i])
+            i += 1
+        else:
+            merged.append(new[j])  # New data overwrites old
+            j += 1
+            if old_date == new_date:
+                i += 1
+    merged.extend(old[i:])
+    merged.extend(new[j:])
+    return merged
+
+
+def _merge_unsorted(old: List[Observation], new: List[Observation]) -> List[Observation]:
+    """Dict-based merge for inputs that are unsorted or repeat a date."""
     seen: Dict[str, Observation] = {}
-    for entry in existing:
-        d = entry.get('date')
-        if not d:
-            logger.warning("  Skipping existing observation with missing date: %s", entry)
-            continue
-        seen[d] = entry
-    for entry in new_data:
-        d = entry.get('date')
-        if not d:
-            logger.warning("  Skipping new observation with missing date: %s", entry)
-            continue
-        seen[d] = entry  # New data overwrites old
+    for entry in old:
+        seen[entry['date']] = entry
+    for entry in new:
+        seen[entry['date']] = entry  # New data overwrites old
 
-    merged = sorted(seen.values(), key=lambda x: x.get('date', ''))
-    return merged
+    # Dates are normalized YYYY-MM-DD, so string order is chronological.
+    return sorted(seen.values(), key=itemgetter('date'))
 
 
 def compute_metrics(history: List[Observation]) -> Dict[str, Any]:
@@ -236,6 +366,7 @@ def build_commodity_record(
     metrics: Dict[str, Any],
     *,
     overrides: Optional[Dict[str, Any]] = None,
+    updated_at: Optional[str] = None,
 ) -> Dict[str, Any]:
     """Build/refresh a commodity record's top-level fields from its history.
 
@@ -245,6 +376,8 @@ def build_commodity_record(
 
     ``existing`` is mutated and returned. ``overrides`` (e.g. id/name/category
     for a freshly-built record) take precedence over any existing values.
+    ``updated_at`` lets a batch run stamp every record with the same time;
+    it defaults to now.
     """
     record = dict(existing)
     if overrides:
@@ -257,7 +390,7 @@ def build_commodity_record(
     record['derived'] = {'descriptive_stats': metrics}
     record['price'] = latest.get('price')
     record['date'] = latest.get('date')
-    record['updated_at'] = datetime.now().isoformat()
+    record['updated_at'] = updated_at or datetime.now().isoformat()
     return record
 
 
@@ -265,19 +398,93 @@ def build_commodity_record(
 # I/O
 # =============================================================================
 
+def dumps_json(data: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes, with orjson when installed.
+
+    Both paths write the same document: non-ASCII text unescaped, NaN and
+    Infinity as ``null``, and anything without a native JSON type (dates and
+    datetimes included) through ``str()``. Only the spelling of exponent
+    floats differs (``1e-05`` vs ``1e-5``), which parses to the same value.
+    Values orjson cannot encode (e.g. integers beyond 64 bits) use stdlib json.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            pass
+    try:
+        text = json.dumps(data, indent=2, default=str, ensure_ascii=False, allow_nan=False)
+    except ValueError:
+        # Non-finite floats: rare, so only then pay for the extra walk.
+        text = json.dumps(nan_to_none(data), indent=2, default=str, ensure_ascii=False)
+    return text.encode('utf-8')
+
+
+# fdatasync skips flushing metadata the reader doesn't need; not every
+# platform has it (macOS, Windows), so fall back to a full fsync there.
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+
+def _fsync_dir(dir_name: str) -> None:
+    """Persist a rename by syncing its directory (best effort; POSIX only)."""
+    try:
+        dir_fd = os.open(dir_name or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+# mkstemp creates files 0600; data files must stay readable by the web app and
+# bots (often another user), so the temp file gets the mode open() would give.
+# Read once at import: os.umask can only be queried by setting it, which is
+# not safe once the fetch worker threads are running.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(filepath: str) -> int:
+    """Mode for a rewritten *filepath*: the current file's, else 0666 minus the umask."""
+    try:
+        return stat.S_IMODE(os.stat(filepath).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
 def save_atomic(filepath: str, data: Dict[str, Any]) -> bool:
-    """Atomic write: write to .tmp then rename to avoid corruption."""
+    """Atomic write: write to .tmp then rename to avoid corruption.
+
+    The payload is serialized up front and written with raw ``os.write``; the
+    temp file is fdatasync'ed before the rename and the directory afterwards,
+    so a crash leaves either the old file or the complete new one. The new
+    file keeps the mode of the one it replaces (see _target_mode).
+    """
     try:
+        payload = memoryview(dumps_json(data))
         dir_name = os.path.dirname(filepath)
         fd, tmp_path = tempfile.mkstemp(dir=dir_name, suffix='.tmp')
         try:
-            with os.fdopen(fd, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            try:
+                while payload:
+                    payload = payload[os.write(fd, payload):]
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
+            os.chmod(tmp_path, _target_mode(filepath))
             os.replace(tmp_path, filepath)
-            return True
         except Exception:
             os.unlink(tmp_path)
             raise
+        _fsync_dir(dir_name)
+        return True
     except Exception as e:
         logger.error(f"  Atomic save failed for {filepath}: {e}")
         return False
@@ -4,10 +4,17 @@ import os
 import logging
 from typing import Any, Dict, List, Optional, Tuple
 
-from scripts.fetchers._shared import parse_records, safe_get
+from scripts.fetchers._shared import loads_json, parse_records, safe_get
 
 logger = logging.getLogger(__name__)
 
+# Query params shared by every series: newest-first values only.
+_EIA_FIXED_PARAMS: Tuple[Tuple[str, str], ...] = (
+    ("data[0]", "value"),
+    ("sort[0][column]", "period"),
+    ("sort[0][direction]", "desc"),
+)
+
 
 def _get_eia_api_key() -> str:
     """Read EIA_API_KEY at call time so env changes are picked up."""
@@ -20,14 +27,8 @@ def _build_eia_params(
     length: int,
 ) -> List[Tuple[str, Any]]:
     """Build query params as list of tuples so repeated facet keys are preserved."""
-    base: Dict[str, Any] = {
-        "api_key": api_key,
-        "length": length,
-        "data[0]": "value",
-        "sort[0][column]": "period",
-        "sort[0][direction]": "desc",
-    }
-    query_params: List[Tuple[str, Any]] = list(base.items())
+    query_params: List[Tuple[str, Any]] = [("api_key", api_key), ("length", length)]
+    query_params.extend(_EIA_FIXED_PARAMS)
     for key, values in facets.items():
         for val in values:
             query_params.append((f"facets[{key}][]", val))
@@ -52,8 +53,8 @@ def fetch_eia_v2(
 
     try:
         resp = safe_get(api_url, params=query_params)
-        records = resp.json().get("response", {}).get("data", [])
+        records = loads_json(resp.content).get("response", {}).get("data", [])
         return parse_records(records, value_key="value", date_key="period")
     except Exception as e:
-        logger.error(f"  Error fetching EIA: {e}")
+        logger.error(f"  Error fetching EIA {api_url} {facets}: {e}")
         return None
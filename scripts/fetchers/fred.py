@@ -4,10 +4,12 @@ import os
 import logging
 from typing import Any, Dict, List, Optional
 
-from scripts.fetchers._shared import parse_records, safe_get
+from scripts.fetchers._shared import loads_json, parse_records, safe_get
 
 logger = logging.getLogger(__name__)
 
+FRED_OBSERVATIONS_URL = "https://api.stlouisfed.org/fred/series/observations"
+
 
 def _get_fred_api_key() -> str:
     """Read FRED_API_KEY at call time so env changes are picked up."""
@@ -21,7 +23,6 @@ def fetch_fred_series(series_id: str, limit: int = 730) -> Optional[List[Dict[st
         logger.warning("  Missing FRED_API_KEY")
         return None
 
-    url = "https://api.stlouisfed.org/fred/series/observations"
     params: Dict[str, Any] = {
         "series_id": series_id,
         "api_key": api_key,
@@ -31,8 +32,8 @@ def fetch_fred_series(series_id: str, limit: int = 730) -> Optional[List[Dict[st
     }
 
     try:
-        resp = safe_get(url, params=params)
-        observations = resp.json().get("observations", [])
+        resp = safe_get(FRED_OBSERVATIONS_URL, params=params)
+        observations = loads_json(resp.content).get("observations", [])
         return parse_records(observations, value_key="value", date_key="date", skip_values=(".", ""))
     except Exception as e:
         logger.error(f"  Error fetching FRED {series_id}: {e}")
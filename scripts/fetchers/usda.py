@@ -10,7 +10,7 @@ import os
 import logging
 from typing import Any, Dict, List, Optional
 
-from scripts.fetchers._shared import Observation, safe_get
+from scripts.fetchers._shared import Observation, loads_json, safe_get
 
 logger = logging.getLogger(__name__)
 
@@ -111,7 +111,7 @@ def fetch_usda_nass(
 
     try:
         resp = safe_get(USDA_API_BASE, params=params)
-        records = resp.json().get("data", [])
+        records = loads_json(resp.content).get("data", [])
 
         if not records:
             logger.warning(f"  No USDA data for {commodity_desc}")
@@ -1,13 +1,18 @@
 """Yahoo Finance fetcher — commodity futures prices."""
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
-from scripts.fetchers._shared import Observation, safe_get
+from scripts.fetchers._shared import Observation, loads_json, safe_get
 
 logger = logging.getLogger(__name__)
 
+# Daily bars are stamped in unix seconds; the UTC calendar day is the whole
+# number of days since the epoch, so no datetime needs to be built per bar.
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+_SECONDS_PER_DAY = 86400
+
 
 def _timestamps_to_observations(
     timestamps: List[int],
@@ -18,7 +23,7 @@ def _timestamps_to_observations(
     for ts, price in zip(timestamps, closes):
         if price is None:
             continue
-        dt = datetime.fromtimestamp(ts, tz=timezone.utc).strftime('%Y-%m-%d')
+        dt = date.fromordinal(_EPOCH_ORDINAL + int(ts // _SECONDS_PER_DAY)).isoformat()
         results.append({"date": dt, "price": round(float(price), 4)})
     return results
 
@@ -42,7 +47,7 @@ def fetch_yahoo_finance(symbol: str, days: int = 730) -> Optional[List[Dict[str,
 
     try:
         resp = safe_get(url, params=params)
-        chart = resp.json().get("chart", {}).get("result", [])
+        chart = loads_json(resp.content).get("chart", {}).get("result", [])
         if not chart:
             return None
 
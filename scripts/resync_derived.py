@@ -16,17 +16,20 @@ Does NOT catch: a wrong/short history (it trusts the history as-is) — that's t
 fetcher's job. Run from project root:  venv/bin/python scripts/resync_derived.py
 """
 import glob
-import json
 import os
 import sys
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from scripts.fetchers._shared import compute_metrics  # noqa: E402
+from scripts.fetchers._shared import compute_metrics, loads_json, save_atomic  # noqa: E402
 
 
 def resync_file(path):
-    with open(path, 'r') as f:
-        d = json.load(f)
+    """Rewrite *path* if stale; return (before, after) or None if it was current.
+
+    Raises OSError if the stale file could not be written.
+    """
+    with open(path, 'rb') as f:
+        d = loads_json(f.read())
     history = d.get('history') or []
     if not history:
         return None
@@ -45,25 +48,31 @@ def resync_file(path):
     d['date'] = latest['date']
     d['metrics'] = metrics
     d['derived'] = {'descriptive_stats': metrics}
-    tmp = path + '.tmp'
-    with open(tmp, 'w') as f:
-        json.dump(d, f, indent=2, default=str)
-    os.replace(tmp, path)
+    if not save_atomic(path, d):
+        raise OSError(f"could not write {path}")
     return before, (latest['price'], latest['date'], metrics.get('observations'))
 
 
 def main():
+    """Resync every data file; return the exit status (1 if any write failed)."""
     changed = 0
-    for path in sorted(glob.glob('data/*.json')):
-        result = resync_file(path)
+    failed = 0
+    paths = sorted(glob.glob('data/*.json'))
+    for path in paths:
+        try:
+            result = resync_file(path)
+        except OSError as e:
+            print(f"FAILED {os.path.basename(path)}: {e}", file=sys.stderr)
+            failed += 1
+            continue
         if result:
             (op, od, oo), (np, nd, no) = result
             print(f"resynced {os.path.basename(path)}: "
                   f"price {op}->{np}  date {od}->{nd}  obs {oo}->{no}")
             changed += 1
-    print(f"done: {changed} file(s) resynced ({len(glob.glob('data/*.json'))} scanned)")
-    return changed
+    print(f"done: {changed} file(s) resynced, {failed} failed ({len(paths)} scanned)")
+    return 1 if failed else 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
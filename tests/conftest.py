@@ -4,7 +4,9 @@ import os
 # (and its config) are imported. Prod uses FileSystemCache for the response/memoize
 # cache; a stale entry persisting across runs would make route tests flaky.
 os.environ['CACHE_TYPE'] = 'NullCache'
+import copy
 import json
+import shutil
 import pytest
 from flask import Flask
 from app import create_app
@@ -49,16 +51,23 @@ SAMPLE_GOLD = {
 }
 
 
+# Serialized once; fixtures write these bytes instead of re-encoding.
+SAMPLE_GOLD_BYTES = json.dumps(SAMPLE_GOLD).encode()
+SAMPLE_GOLD_NO_DERIVED_BYTES = json.dumps(
+    {k: v for k, v in SAMPLE_GOLD.items() if k != "derived"}
+).encode()
+
+
 def write_sample_data(data_dir, commodities=None):
     """Write commodity JSON files into a data directory.
 
     *commodities* defaults to a single gold entry if not provided.
     """
     if commodities is None:
-        commodities = [SAMPLE_GOLD]
+        (data_dir / "gold.json").write_bytes(SAMPLE_GOLD_BYTES)
+        return
     for item in commodities:
-        with open(data_dir / f"{item['id']}.json", "w") as f:
-            json.dump(item, f)
+        (data_dir / f"{item['id']}.json").write_text(json.dumps(item))
 
 
 # ------------------------------------------------------------------
@@ -66,6 +75,18 @@ def write_sample_data(data_dir, commodities=None):
 # ------------------------------------------------------------------
 
 
+@pytest.fixture
+def sample_gold():
+    """A deep copy of SAMPLE_GOLD that the test is free to modify."""
+    return copy.deepcopy(SAMPLE_GOLD)
+
+
+@pytest.fixture(scope="session")
+def sample_gold_no_derived_bytes():
+    """gold.json contents without the derived block (metrics-only fallback)."""
+    return SAMPLE_GOLD_NO_DERIVED_BYTES
+
+
 class _TestConfig:
     TESTING = True
     CACHE_TYPE = "SimpleCache"
@@ -74,28 +95,76 @@ class _TestConfig:
     JSON_DATA_DIR = ""
 
 
-@pytest.fixture
-def app_with_data(tmp_path):
-    """Bare Flask app with app context and a temp data directory.
+def _make_sample_root(root):
+    """Lay out ``root/app`` and ``root/data`` (with the sample commodity)."""
+    (root / "app").mkdir()
+    data_dir = root / "data"
+    data_dir.mkdir()
+    write_sample_data(data_dir)
+    return root
 
-    Useful for testing data_handler functions directly (no routes).
-    """
+
+def _bare_app(root):
+    """Bare Flask app (fresh cache) pointed at the sample layout under *root*."""
     app = Flask(__name__)
     app.config["CACHE_TYPE"] = "SimpleCache"
     cache.init_app(app)
+    app.root_path = str(root / "app")
+    app.config["JSON_DATA_DIR"] = str(root / "data")
+    return app
 
-    app_dir = tmp_path / "app"
-    app_dir.mkdir()
-    data_dir = tmp_path / "data"
-    data_dir.mkdir()
 
-    write_sample_data(data_dir)
+@pytest.fixture(scope="session")
+def sample_data_root(tmp_path_factory):
+    """Read-only sample layout, written once per session."""
+    return _make_sample_root(tmp_path_factory.mktemp("bwdata"))
 
-    app.root_path = str(app_dir)
-    app.config["JSON_DATA_DIR"] = str(data_dir)
 
-    with app.app_context():
-        yield app
+@pytest.fixture(scope="session")
+def sample_app(sample_data_root):
+    """Bare Flask app over the shared sample, built once per session.
+
+    Its cache is shared by every test using it, which is safe because the
+    sample directory is never written to.
+    """
+    return _bare_app(sample_data_root)
+
+
+@pytest.fixture(scope="module")
+def sample_views(sample_app):
+    """data_handler views of the shared sample, computed once per module.
+
+    For read-only assertions: ``all`` and ``1w`` are get_all_commodities()
+    over those ranges, ``gold`` is get_commodity("gold").
+    """
+    from app.data_handler import get_all_commodities, get_commodity
+
+    with sample_app.app_context():
+        return {
+            "all": get_all_commodities("ALL"),
+            "1w": get_all_commodities("1W"),
+            "gold": get_commodity("gold"),
+        }
+
+
+@pytest.fixture
+def app_with_data(sample_app):
+    """The shared sample app with its app context pushed for the test.
+
+    Useful for testing data_handler functions directly (no routes). The data
+    directory is shared across tests: use ``app_with_mutable_data`` to write
+    to it.
+    """
+    with sample_app.app_context():
+        yield sample_app
+
+
+@pytest.fixture
+def app_with_mutable_data(tmp_path, sample_data_root):
+    """Like ``app_with_data``, but over a private copy tests may modify."""
+    shutil.copytree(sample_data_root, tmp_path, dirs_exist_ok=True)
+    with _bare_app(tmp_path).app_context() as ctx:
+        yield ctx.app
 
 
 @pytest.fixture
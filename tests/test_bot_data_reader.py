@@ -1,6 +1,7 @@
 """Tests for bot data-reader safety helpers."""
 import importlib.util
 import json
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
@@ -123,19 +124,68 @@ def test_get_top_movers_does_not_crash_on_none_pct(tmp_path):
     assert [l["name"] for l in losers] == ["Loser"]
 
 
+def test_get_top_movers_rebuilds_only_when_data_changes(tmp_path, monkeypatch):
+    path = tmp_path / "gainer.json"
+    path.write_text(json.dumps({
+        "name": "Gainer", "price": 10.0,
+        "derived": {"descriptive_stats": {"pct_change_1_obs": 5.0}},
+    }))
+    reader = load_bot_data_reader(tmp_path)
+    reader._invalidate_all_commodities_cache()
+
+    calls = {"n": 0}
+    real_load_all = reader._load_all_commodities
+
+    def counting_load_all():
+        calls["n"] += 1
+        return real_load_all()
+
+    monkeypatch.setattr(reader, "_load_all_commodities", counting_load_all)
+
+    first = reader.get_top_movers(5)
+    assert reader.get_top_movers(5) == first
+    assert reader.get_top_movers(3) == first
+    assert calls["n"] == 1
+
+    # Rewriting a file in place (directory mtime untouched) still rebuilds.
+    path.write_text(json.dumps({
+        "name": "Gainer", "price": 9.0,
+        "derived": {"descriptive_stats": {"pct_change_1_obs": -2.0}},
+    }))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    gainers, losers = reader.get_top_movers(5)
+    assert calls["n"] == 2
+    assert gainers == []
+    assert [l["name"] for l in losers] == ["Gainer"]
+
+
+def test_get_commodities_by_category_uses_category_order(tmp_path):
+    (tmp_path / "brent_oil.json").write_text(json.dumps({"name": "Brent"}))
+    (tmp_path / "gold.json").write_text(json.dumps({"name": "Gold"}))
+    reader = load_bot_data_reader(tmp_path)
+    reader.CATEGORIES["energy"] = ["gold", "missing", "brent_oil"]
+    reader._invalidate_all_commodities_cache()
+
+    result = reader.get_commodities_by_category("Energy")
+    assert [(c["id"], c["name"]) for c in result] == [("gold", "Gold"), ("brent_oil", "Brent")]
+    assert reader.get_commodities_by_category("unknown") == []
+
+
 def test_get_all_commodities_caches_directory_scan(tmp_path, monkeypatch):
     (tmp_path / "a.json").write_text(json.dumps({"name": "A", "price": 1.0}))
     reader = load_bot_data_reader(tmp_path)
     reader._invalidate_all_commodities_cache()
 
     calls = {"n": 0}
-    real_listdir = reader.os.listdir
+    real_scandir = reader.os.scandir
 
-    def counting_listdir(path):
+    def counting_scandir(path):
         calls["n"] += 1
-        return real_listdir(path)
+        return real_scandir(path)
 
-    monkeypatch.setattr(reader.os, "listdir", counting_listdir)
+    monkeypatch.setattr(reader.os, "scandir", counting_scandir)
 
     first = reader.get_all_commodities()
     second = reader.get_all_commodities()
@@ -143,3 +193,115 @@ def test_get_all_commodities_caches_directory_scan(tmp_path, monkeypatch):
     # Second call served from cache: no extra directory scan.
     assert calls["n"] == 1
     assert second == first
+
+
+def test_get_commodity_data_rereads_changed_file_and_returns_copies(tmp_path):
+    path = tmp_path / "brent_oil.json"
+    path.write_text(json.dumps({"name": "Brent", "price": 75.0}))
+    reader = load_bot_data_reader(tmp_path)
+
+    first = reader.get_commodity_data("brent_oil")
+    first["price"] = 0.0
+    assert reader.get_commodity_data("brent_oil")["price"] == 75.0
+
+    path.write_text(json.dumps({"name": "Brent", "price": 80.5}))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert reader.get_commodity_data("brent_oil")["price"] == 80.5
+
+
+def test_directory_listing_is_reused_until_directory_changes(tmp_path, monkeypatch):
+    (tmp_path / "b.json").write_text(json.dumps({"name": "B"}))
+    (tmp_path / "schema.json").write_text("{}")
+    reader = load_bot_data_reader(tmp_path)
+
+    calls = {"n": 0}
+    real_scandir = reader.os.scandir
+
+    def counting_scandir(path):
+        calls["n"] += 1
+        return real_scandir(path)
+
+    monkeypatch.setattr(reader.os, "scandir", counting_scandir)
+
+    assert reader.get_available_commodities() == ["b"]
+    assert reader.get_available_commodities() == ["b"]
+    assert calls["n"] == 1
+
+    (tmp_path / "a.json").write_text(json.dumps({"name": "A"}))
+    st = tmp_path.stat()
+    os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert reader.get_available_commodities() == ["a", "b"]
+    assert calls["n"] == 2
+
+
+def test_missing_data_dir_yields_empty_results(tmp_path):
+    reader = load_bot_data_reader(tmp_path / "absent")
+    reader._invalidate_all_commodities_cache()
+
+    assert reader.get_available_commodities() == []
+    assert reader.get_all_commodities() == []
+    assert reader.get_commodity_data("gold") is None
+
+
+def test_search_commodity_matches_names_via_index(tmp_path):
+    (tmp_path / "brent_oil.json").write_text(json.dumps({"name": "Brent Crude Oil"}))
+    (tmp_path / "gold.json").write_text(json.dumps({"name": "Gold"}))
+    reader = load_bot_data_reader(tmp_path)
+    reader._invalidate_all_commodities_cache()
+
+    assert reader.search_commodity("  GOLD ")["name"] == "Gold"
+    assert reader.search_commodity("brent crude oil")["name"] == "Brent Crude Oil"
+    assert reader.search_commodity("crude")["name"] == "Brent Crude Oil"
+    assert reader.search_commodity("platinum") is None
+
+
+def test_index_rebuild_leaves_published_snapshot_intact(tmp_path):
+    (tmp_path / "gold.json").write_text(json.dumps({"name": "Gold"}))
+    reader = load_bot_data_reader(tmp_path)
+    reader._invalidate_all_commodities_cache()
+
+    before = reader._refresh_indexes()
+    (tmp_path / "silver.json").write_text(json.dumps({"name": "Silver"}))
+    os.utime(tmp_path / "silver.json", ns=(2**62, 2**62))
+    after = reader._refresh_indexes()
+
+    # Readers holding the old snapshot keep a complete, unmodified index.
+    assert after is not before
+    assert before.name_index == {"gold": "gold"}
+    assert after.name_index == {"gold": "gold", "silver": "silver"}
+    assert reader.search_commodity("silv")["name"] == "Silver"
+
+
+def test_indexes_tolerate_null_name(tmp_path):
+    (tmp_path / "gold.json").write_text(json.dumps({"name": None, "derived": {"descriptive_stats": {"pct_change_1_obs": 1.0}}}))
+    (tmp_path / "silver.json").write_text(json.dumps({"name": "Silver"}))
+    reader = load_bot_data_reader(tmp_path)
+    reader._invalidate_all_commodities_cache()
+
+    gainers, _losers = reader.get_top_movers(5)
+    assert [c["id"] for c in gainers] == ["gold"]
+    assert reader.search_commodity("silver")["name"] == "Silver"
+
+
+def test_reader_works_without_project_root_helpers(tmp_path, monkeypatch):
+    """bots/ may be deployed on its own; datafiles.py is then not importable."""
+    monkeypatch.setitem(sys.modules, "datafiles", None)
+    (tmp_path / "gold.json").write_text(json.dumps({"name": "Gold"}))
+    (tmp_path / "schema.json").write_text("{}")
+    reader = load_bot_data_reader(tmp_path)
+    reader._invalidate_all_commodities_cache()
+
+    assert reader.get_available_commodities() == ["gold"]
+    assert reader.search_commodity("gold")["name"] == "Gold"
+    assert reader.get_all_commodities()[0]["id"] == "gold"
+
+
+def test_format_price_message_formats_iso_date(tmp_path):
+    reader = load_bot_data_reader(tmp_path)
+    msg = reader.format_price_message({"name": "Gold", "price": 1.0, "date": "2024-03-05"})
+    assert "Updated: Mar 05" in msg
+    # Non-ISO dates are shown verbatim.
+    assert "Updated: 5 March" in reader.format_price_message({"name": "Gold", "date": "5 March"})
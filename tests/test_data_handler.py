@@ -1,6 +1,9 @@
 import json
 import os
-from datetime import datetime
+import re
+import threading
+import time
+from pathlib import Path
 import pytest
 
 # Import functions under test
@@ -8,10 +11,13 @@ from app.data_handler import (
     build_market_summary,
     get_all_commodities,
     get_commodity,
-    filter_history_by_range
+    filter_history_by_range,
+    _infer_is_daily,
+    _StaleWhileRevalidate,
 )
+from scripts.fetchers._shared import compute_metrics, merge_history
 
-# app_with_data fixture is provided by conftest.py
+# app_with_data and the sample_gold* fixtures are provided by conftest.py
 
 
 # ------------------------------------------------------------------
@@ -32,9 +38,62 @@ def test_filter_history_by_range_uses_latest_date():
     assert filtered[0]["date"] == "2024-01-10"
 
 
-def test_get_all_commodities_uses_filtered_history_for_display_change(app_with_data):
+def test_filter_history_by_range_includes_cutoff_boundary():
+    """The entry exactly on the cutoff date is kept; everything older is dropped."""
+    history = [{"date": f"2024-01-{day:02d}", "price": day} for day in range(1, 32)]
+
+    filtered = filter_history_by_range(history, "1W")
+
+    assert [e["date"] for e in filtered][0] == "2024-01-24"
+    assert filtered[-1]["date"] == "2024-01-31"
+    assert len(filtered) == 8
+
+
+def test_filter_history_by_range_tolerates_null_date():
+    """A row with "date": null must not make the range lookup raise."""
+    history = [
+        {"date": "2024-01-01"},
+        {"date": None},
+        {"date": "2024-01-10"},
+    ]
+
+    filtered = filter_history_by_range(history, "1W")
+
+    assert filtered == [{"date": "2024-01-10"}]
+
+
+def test_filter_history_by_range_drops_dateless_rows_inside_window():
+    """Rows with no date are left out of the window, as the old strptime scan did."""
+    history = [
+        {"date": "2024-01-01"},
+        {"date": "2024-01-08"},
+        {"date": None},
+        {"price": 1.0},
+        {"date": "2024-01-10"},
+    ]
+
+    filtered = filter_history_by_range(history, "1W")
+
+    assert filtered == [{"date": "2024-01-08"}, {"date": "2024-01-10"}]
+
+
+def test_filter_history_by_range_relies_on_ascending_merged_history():
+    """The binary-search window assumes oldest-first history, which merge_history guarantees."""
+    history = merge_history(
+        [{"date": "2024-01-10", "price": 3}, {"date": "2024-01-01", "price": 1}],
+        [{"date": "2024-01-05", "price": 2}],
+    )
+    dates = [e["date"] for e in history]
+    assert dates == sorted(dates)
+
+    filtered = filter_history_by_range(history, "1W")
+
+    assert [e["date"] for e in filtered] == ["2024-01-05", "2024-01-10"]
+
+
+def test_get_all_commodities_uses_filtered_history_for_display_change(sample_views):
     """get_all_commodities() derives display change from filtered history window."""
-    commodities = get_all_commodities(date_range="ALL")
+    commodities = sample_views["all"]
 
     assert len(commodities) == 1
     item = commodities[0]
@@ -54,9 +113,9 @@ def test_get_all_commodities_uses_filtered_history_for_display_change(app_with_d
     assert item["frequency_label"] == "Daily data"
 
 
-def test_derived_stats_exposed(app_with_data):
+def test_derived_stats_exposed(sample_views):
     """Derived stats are exposed to templates."""
-    commodities = get_all_commodities()
+    commodities = sample_views["all"]
 
     item = commodities[0]
     derived = item["derived_stats"]
@@ -65,15 +124,16 @@ def test_derived_stats_exposed(app_with_data):
     assert derived["observations"] == 3
 
 
-def test_get_all_commodities_skips_unsafe_id_files(app_with_data):
+def test_get_all_commodities_skips_unsafe_id_files(app_with_mutable_data):
     """A *.json with an unsafe id stem must not enter the public list,
     matching get_commodity's id validation."""
     from flask import current_app
 
     data_dir = current_app.config["JSON_DATA_DIR"]
     # Filename stem 'bad name' contains a space -> fails _is_safe_commodity_id.
-    with open(os.path.join(data_dir, "bad name.json"), "w") as f:
-        json.dump({"id": "bad name", "name": "Bad", "price": 1.0, "history": []}, f)
+    (Path(data_dir) / "bad name.json").write_text(
+        json.dumps({"id": "bad name", "name": "Bad", "price": 1.0, "history": []})
+    )
 
     commodities = get_all_commodities()
 
@@ -84,6 +144,85 @@ def test_get_all_commodities_skips_unsafe_id_files(app_with_data):
     assert "Bad" not in {c.get("name") for c in commodities}
 
 
+def _wait_for_refreshes(snapshots):
+    deadline = time.monotonic() + 5
+    while snapshots._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not snapshots._refreshing
+
+
+def test_stale_while_revalidate_serves_old_value_while_refreshing():
+    """An expired entry is served as-is while exactly one background rebuild runs."""
+    snapshots = _StaleWhileRevalidate(ttl_seconds=0)
+    release = threading.Event()
+    calls = []
+
+    def build():
+        calls.append(1)
+        if len(calls) > 1:
+            release.wait(5)
+        return len(calls)
+
+    assert snapshots.get("k", build) == 1
+    assert snapshots.get("k", build) == 1  # stale, refresh started
+    assert snapshots.get("k", build) == 1  # refresh in flight, not restarted
+    release.set()
+
+    _wait_for_refreshes(snapshots)
+    assert len(calls) == 2
+    assert snapshots.get("k", build) == 2
+
+
+def test_get_all_commodities_serves_stale_list_then_refreshed_one(app_with_mutable_data, sample_gold, monkeypatch):
+    """A changed data file shows up once the background refresh has run."""
+    from app import data_handler
+
+    monkeypatch.setattr(data_handler._COMMODITIES_SNAPSHOTS, "ttl_seconds", 0)
+    assert get_all_commodities()[0]["name"] == "Gold"
+
+    path = Path(app_with_mutable_data.config["JSON_DATA_DIR"]) / "gold.json"
+    path.write_text(json.dumps({**sample_gold, "name": "Gold v2"}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    # Served immediately from the stale snapshot while it is rebuilt.
+    assert get_all_commodities()[0]["name"] == "Gold"
+    _wait_for_refreshes(data_handler._COMMODITIES_SNAPSHOTS)
+    assert get_all_commodities()[0]["name"] == "Gold v2"
+
+
+def test_get_all_commodities_returns_per_call_item_copies(app_with_data):
+    """One caller setting a field must not leak into later calls."""
+    first = get_all_commodities("1W")
+    first[0]["name"] = "Changed by a caller"
+
+    assert get_all_commodities("1W")[0]["name"] == "Gold"
+
+
+def test_infer_is_daily_uses_history_cadence_for_unknown_sources():
+    """Sources outside the known-daily set are classified by median interval."""
+    item = {"id": "copper", "source_type": "FRED"}
+    monthly = [{"date": f"2023-{m:02d}-01", "price": 1.0} for m in range(1, 13)]
+    daily = [{"date": f"2024-01-{d:02d}", "price": 1.0} for d in range(1, 13)]
+
+    assert _infer_is_daily(item, monthly) is False
+    assert _infer_is_daily(item, daily) is True
+    # Repeat calls over the same window are answered from the memo.
+    assert _infer_is_daily(item, monthly) is False
+
+
+def test_get_all_commodities_include_history_flag(app_with_data):
+    """History is copied for the display window only, or omitted entirely."""
+    with_history = get_all_commodities("1W", include_history=True)[0]
+    without_history = get_all_commodities("1W", include_history=False)[0]
+
+    assert [e["date"] for e in with_history["history"]] == ["2024-01-09", "2024-01-10"]
+    assert "history" not in without_history
+    # Display fields are still derived from the window either way.
+    assert without_history["change"] == with_history["change"] == pytest.approx(20.0)
+    assert without_history["date"] == "2024-01-10"
+
+
 def test_build_market_summary_counts_breadth_and_movers():
     """Market summary describes the current display set without extra data sources."""
     commodities = [
@@ -165,10 +304,10 @@ def test_build_market_summary_top_movers_sorted_and_capped():
     assert summary["biggest_down"]["id"] == "dn7"
 
 
-def test_date_range_changes_display_metrics(app_with_data):
+def test_date_range_changes_display_metrics(sample_views):
     """Date-range filtering affects list display metrics via filtered history."""
-    all_range = get_all_commodities("ALL")[0]
-    short_range = get_all_commodities("1W")[0]
+    all_range = sample_views["all"][0]
+    short_range = sample_views["1w"][0]
 
     assert all_range["change"] != short_range["change"]
     assert all_range["change_percent"] != short_range["change_percent"]
@@ -177,27 +316,19 @@ def test_date_range_changes_display_metrics(app_with_data):
     assert short_range["change_percent"] == pytest.approx((20.0 / 1980.0) * 100)
 
 
-def test_get_commodity_prev_observation(app_with_data):
+def test_get_commodity_prev_observation(sample_views):
     """get_commodity() exposes previous observation safely."""
-    item = get_commodity("gold")
+    item = sample_views["gold"]
 
     assert item["prev_price"] == 1980.0
     assert item["prev_date"] == "2024-01-09"
 
 
-def test_missing_derived_falls_back_to_metrics(app_with_data):
+def test_missing_derived_falls_back_to_metrics(app_with_mutable_data, sample_gold_no_derived_bytes):
     """Graceful handling of missing derived stats (fallback)."""
-    # Load and corrupt JSON
-    data_dir = os.path.join(app_with_data.root_path, "..", "data")
-    path = os.path.join(data_dir, "gold.json")
-
-    with open(path, "r") as f:
-        data = json.load(f)
-
-    del data["derived"]
-
-    with open(path, "w") as f:
-        json.dump(data, f)
+    # Rewrite gold.json without its derived block
+    data_dir = app_with_mutable_data.config["JSON_DATA_DIR"]
+    (Path(data_dir) / "gold.json").write_bytes(sample_gold_no_derived_bytes)
 
     item = get_commodity("gold")
 
@@ -205,7 +336,16 @@ def test_missing_derived_falls_back_to_metrics(app_with_data):
     assert item["change_percent"] == 1.01
 
 
-def test_metrics_are_observation_based_not_calendar_based():
+@pytest.fixture(scope="module")
+def two_point_metrics():
+    """compute_metrics() over two observations 4 years apart."""
+    return compute_metrics([
+        {"date": "2020-01-01", "price": 100.0},
+        {"date": "2024-01-01", "price": 110.0},
+    ])
+
+
+def test_metrics_are_observation_based_not_calendar_based(two_point_metrics):
     """
     Critical legal semantics test.
     
@@ -213,19 +353,7 @@ def test_metrics_are_observation_based_not_calendar_based():
     A "1 observation" change with 4 years between dates should still work.
     This prevents future devs from reintroducing time assumptions.
     """
-    fetch_module = pytest.importorskip(
-        "scripts.fetch_daily_data",
-        reason="scripts/fetch_daily_data.py not found — skipping observation semantics test"
-    )
-    compute_metrics = fetch_module.compute_metrics
-    
-    # Two observations 4 years apart
-    history = [
-        {"date": "2020-01-01", "price": 100.0},
-        {"date": "2024-01-01", "price": 110.0},
-    ]
-
-    metrics = compute_metrics(history)
+    metrics = two_point_metrics
 
     # "1 observation back" is 10.0 change, NOT "1 day back"
     assert metrics["abs_change_1_obs"] == 10.0
@@ -239,69 +367,50 @@ def test_metrics_are_observation_based_not_calendar_based():
 # Semantic Regression Tests (Forbidden Strings)
 # ------------------------------------------------------------------
 
-def test_templates_do_not_contain_forbidden_strings():
+# Forbidden strings in UI context (case-insensitive). Templates are scanned as
+# raw bytes: every word and context phrase is ASCII, so no decode is needed.
+_FORBIDDEN_RE = re.compile(rb'return|signal|forecast|predict|recommendation', re.IGNORECASE)
+
+# Allow certain exceptions (negation phrases near the forbidden word)
+_ALLOWED_CONTEXTS = [b'does not', b'not for', b'should not', b'no ', b'disclaimer', b'generate', b'changelog', b'window']
+
+
+@pytest.fixture(scope="session")
+def template_paths():
+    """Every HTML template under app/templates (walked once per session)."""
+    template_dir = Path(__file__).resolve().parent.parent / 'app' / 'templates'
+    return sorted(template_dir.rglob('*.html'))
+
+
+def test_templates_do_not_contain_forbidden_strings(template_paths):
     """
     Templates must not contain words that imply forward-looking analysis.
     
     This prevents semantic drift back toward trading/signal language.
     """
-    import os
-    import glob
-    
-    # Forbidden strings in UI context (case-insensitive)
-    forbidden = ['return', 'signal', 'forecast', 'predict', 'recommendation']
-    
-    # Find all templates
-    template_dir = os.path.join(os.path.dirname(__file__), '..', 'app', 'templates')
-    templates = glob.glob(os.path.join(template_dir, '**', '*.html'), recursive=True)
-    
-    violations = []
-    for template_path in templates:
-        with open(template_path, 'r') as f:
-            content = f.read().lower()
-            for word in forbidden:
-                if word in content:
-                    # Check it's not in a comment or aria-label explaining what we DON'T do
-                    violations.append(f"{os.path.basename(template_path)}: contains '{word}'")
-    
-    # Allow certain exceptions (negation phrases near the forbidden word)
-    allowed_contexts = ['does not', 'not for', 'should not', 'no ', 'disclaimer', 'generate', 'changelog', 'window']
+    assert template_paths, "no templates found under app/templates"
     filtered_violations = []
-    for v in violations:
-        # Re-check with context
-        template_name = v.split(':')[0]
-        word = v.split("'")[1]
-        template_path = [t for t in templates if os.path.basename(t) == template_name][0]
-        with open(template_path, 'r') as f:
-            content = f.read().lower()
+    for template_path in template_paths:
+        content = template_path.read_bytes()
+        for match in _FORBIDDEN_RE.finditer(content):
             # Widen context window to 200 chars to catch negations further before the word
-            idx = content.find(word)
-            context = content[max(0, idx-200):idx+len(word)+200]
-            if not any(allowed in context for allowed in allowed_contexts):
-                filtered_violations.append(v)
+            context = content[max(0, match.start()-200):match.end()+200].lower()
+            if not any(allowed in context for allowed in _ALLOWED_CONTEXTS):
+                filtered_violations.append(
+                    f"{template_path.name}: contains '{match.group().lower().decode()}'"
+                )
     
     assert len(filtered_violations) == 0, f"Forbidden strings found: {filtered_violations}"
 
 
-def test_metric_naming_uses_observation_based_keys():
+def test_metric_naming_uses_observation_based_keys(two_point_metrics):
     """
     Metrics must use observation-based naming, not calendar-based.
     
     This locks in legal semantics and prevents future developers from
     accidentally reintroducing time-based assumptions.
     """
-    fetch_module = pytest.importorskip(
-        "scripts.fetch_daily_data",
-        reason="scripts/fetch_daily_data.py not found — skipping metric naming test"
-    )
-    compute_metrics = fetch_module.compute_metrics
-    
-    history = [
-        {"date": "2024-01-01", "price": 100.0},
-        {"date": "2024-01-02", "price": 110.0},
-    ]
-    
-    metrics = compute_metrics(history)
+    metrics = two_point_metrics
     
     # Required observation-based keys must exist
     required_obs_keys = [
@@ -0,0 +1,88 @@
+"""Tests for the shared data-file helpers (datafiles.py)."""
+import json
+import os
+
+from datafiles import bisect_date, data_signature, list_data_files, load_cached, nan_to_none
+
+
+def test_load_cached_reuses_parse_until_file_changes(tmp_path):
+    """Parsed JSON is reused while unchanged, re-read once the file is rewritten,
+    and callers get top-level copies they can set fields on without touching the
+    cache (nested values such as history are shared)."""
+    path = tmp_path / "gold.json"
+    path.write_text(json.dumps({"name": "Gold", "history": [{"date": "2024-01-01"}]}))
+
+    first = load_cached(str(path))
+    first["name"] = "Mutated"
+    first["change"] = 1.0
+
+    second = load_cached(str(path))
+    assert second["name"] == "Gold"
+    assert "change" not in second
+    assert second["history"] is first["history"]
+
+    path.write_text(json.dumps({"name": "Gold v2", "history": []}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert load_cached(str(path))["name"] == "Gold v2"
+
+
+def test_load_cached_accepts_nan_literals(tmp_path):
+    """Files written by stdlib json may contain NaN; they must still load."""
+    path = tmp_path / "odd.json"
+    path.write_text('{"name": "Odd", "price": NaN}')
+
+    item = load_cached(str(path))
+
+    assert item["name"] == "Odd"
+    assert item["price"] != item["price"]  # NaN
+
+
+def test_list_data_files_skips_non_data_files_and_sorts(tmp_path):
+    """Only commodity *.json files are listed (schema.json excluded), by name."""
+    for name in ("silver.json", "gold.json", "schema.json", "notes.txt"):
+        (tmp_path / name).write_text("{}")
+    (tmp_path / "sub.json").mkdir()
+
+    assert [name for name, _path in list_data_files(str(tmp_path))] == ["gold.json", "silver.json"]
+
+
+def test_data_signature_tracks_count_and_newest_mtime(tmp_path):
+    """A new file or an in-place rewrite changes the signature; a missing dir is (0, 0)."""
+    assert data_signature(str(tmp_path / "missing")) == (0, 0)
+
+    gold = tmp_path / "gold.json"
+    gold.write_text("{}")
+    (tmp_path / "schema.json").write_text("{}")
+    first = data_signature(str(tmp_path))
+    assert first[0] == 1
+
+    st = os.stat(gold)
+    os.utime(gold, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = data_signature(str(tmp_path))
+    assert second[0] == 1 and second != first
+
+
+def test_nan_to_none_replaces_non_finite_floats_at_any_depth():
+    """NaN/Infinity become None in nested dicts and lists; everything else is kept."""
+    data = {"p": float("nan"), "rows": [{"v": float("-inf")}, (1.5, "x")], "n": 3}
+
+    assert nan_to_none(data) == {"p": None, "rows": [{"v": None}, [1.5, "x"]], "n": 3}
+
+
+def test_bisect_date_matches_bisect_left_on_dates():
+    """First index dated on/after the day; ties go left, like bisect_left."""
+    entries = [{"date": d} for d in ("2024-01-01", "2024-01-05", "2024-01-05", "2024-01-09")]
+
+    assert bisect_date(entries, "2023-12-31") == 0
+    assert bisect_date(entries, "2024-01-05") == 1
+    assert bisect_date(entries, "2024-01-06") == 3
+    assert bisect_date(entries, "2024-02-01") == 4
+    assert bisect_date([], "2024-01-01") == 0
+
+    # Dateless entries are stepped over, wherever they sit.
+    gappy = [{"date": "2024-01-01"}, {"date": None}, {}, {"date": "2024-01-09"}]
+    assert bisect_date(gappy, "2024-01-02") == 1
+    assert bisect_date(gappy, "2024-01-01") == 0
+    assert bisect_date(gappy, "2024-02-01") == 4
@@ -1,5 +1,6 @@
 import json
 import os
+import threading
 from typing import Any, Dict, List
 
 from pytest import MonkeyPatch
@@ -138,3 +139,123 @@ def test_update_commodity_writes_headline_matching_history_tail(tmp_path, monkey
     assert written['history'][-1]['price'] == 25.5
     assert written['id'] == 'gold'
     assert written['source_class'] == 'public_market_reference'
+
+
+def test_update_commodity_log_lines_name_the_commodity(tmp_path, monkeypatch: MonkeyPatch, caplog):
+    """Pools run many updates at once, so every line must say which commodity it is about."""
+    monkeypatch.setattr(fetch_daily_data, 'DATA_DIR', str(tmp_path))
+    rows: List[Dict[str, Any]] = [{'date': '2026-01-01', 'price': 10.0}]
+    monkeypatch.setattr(fetch_daily_data, 'fetch_new_data', lambda commodity: list(rows))
+    commodity = {
+        'id': 'gold',
+        'name': 'Gold',
+        'category': 'precious',
+        'unit': 'USD/oz',
+        'source_type': 'YAHOO',
+        'api_config': {},
+    }
+
+    with caplog.at_level('INFO', logger=fetch_daily_data.logger.name):
+        assert fetch_daily_data.update_commodity(commodity) is True
+        assert fetch_daily_data.update_commodity(commodity) is True
+        rows.clear()
+        assert fetch_daily_data.update_commodity(commodity) is False
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert messages and all('[gold]' in m for m in messages)
+    assert any('Success' in m for m in messages)
+    assert any('Unchanged' in m for m in messages)
+    assert any('FAILED' in m for m in messages)
+
+
+def test_main_updates_every_commodity_and_counts_failures(tmp_path, monkeypatch: MonkeyPatch):
+    """main() fans out over per-source worker pools; failures and exceptions are counted, not fatal."""
+    config = [
+        {'id': f'c{i}', 'name': f'C{i}', 'source_type': 'FRED' if i % 2 else 'EIA'}
+        for i in range(5)
+    ]
+    monkeypatch.setattr(fetch_daily_data, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(fetch_daily_data, 'load_config', lambda: config)
+
+    seen = []
+    stamps = set()
+
+    def fake_update(commodity, updated_at=None):
+        seen.append(commodity['id'])
+        stamps.add(updated_at)
+        if commodity['id'] == 'c3':
+            raise RuntimeError('boom')
+        return commodity['id'] != 'c4'
+
+    monkeypatch.setattr(fetch_daily_data, 'update_commodity', fake_update)
+    messages = []
+    monkeypatch.setattr(fetch_daily_data.logger, 'info', lambda msg, *a: messages.append(msg))
+    monkeypatch.setattr(fetch_daily_data.logger, 'error', lambda msg, *a: messages.append(msg))
+
+    fetch_daily_data.main()
+
+    assert sorted(seen) == ['c0', 'c1', 'c2', 'c3', 'c4']
+    assert len(stamps) == 1 and None not in stamps
+    assert 'Fetch complete: 3 success, 2 failed, 5 total' in messages
+    assert any('[c3] Exception while updating: boom' in m for m in messages)
+
+
+def test_main_counts_other_pools_when_one_source_fails(tmp_path, monkeypatch: MonkeyPatch):
+    """A source whose every update raises or fails must not lose the other pools' results."""
+    config = [
+        {'id': f'{source.lower()}{i}', 'name': f'{source} {i}', 'source_type': source}
+        for source in ('FRED', 'EIA', 'YAHOO')
+        for i in range(3)
+    ]
+    monkeypatch.setattr(fetch_daily_data, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(fetch_daily_data, 'load_config', lambda: config)
+
+    threads = {}
+
+    def fake_update(commodity, updated_at=None):
+        threads[commodity['id']] = threading.current_thread().name
+        if commodity['source_type'] == 'FRED':
+            if commodity['id'] == 'fred0':
+                raise RuntimeError('FRED is down')
+            return False
+        return True
+
+    monkeypatch.setattr(fetch_daily_data, 'update_commodity', fake_update)
+    messages = []
+    monkeypatch.setattr(fetch_daily_data.logger, 'info', lambda msg, *a: messages.append(msg))
+    monkeypatch.setattr(fetch_daily_data.logger, 'error', lambda msg, *a: messages.append(msg))
+
+    fetch_daily_data.main()
+
+    assert 'Fetch complete: 6 success, 3 failed, 9 total' in messages
+    assert len(threads) == 9
+    assert all(name.startswith(f"fetch-{cid.rstrip('0123456789').upper()}") for cid, name in threads.items())
+
+
+def test_update_commodity_skips_rewrite_when_only_timestamp_would_change(tmp_path, monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(fetch_daily_data, 'DATA_DIR', str(tmp_path))
+    rows: List[Dict[str, Any]] = [{'date': '2026-01-01', 'price': 10.0}]
+    monkeypatch.setattr(fetch_daily_data, 'fetch_new_data', lambda commodity: list(rows))
+    saves = []
+    real_save = fetch_daily_data.save_atomic
+    monkeypatch.setattr(
+        fetch_daily_data, 'save_atomic', lambda path, data: saves.append(path) or real_save(path, data)
+    )
+    commodity = {
+        'id': 'iron_ore',
+        'name': 'Iron Ore',
+        'category': 'metals',
+        'unit': 'USD/t',
+        'source_type': 'FRED',
+        'api_config': {},
+    }
+
+    assert fetch_daily_data.update_commodity(commodity, '2026-01-02T06:00:00') is True
+    assert fetch_daily_data.update_commodity(commodity, '2026-01-03T06:00:00') is True
+    assert len(saves) == 1
+    written = json.loads((tmp_path / 'iron_ore.json').read_text())
+    assert written['updated_at'] == '2026-01-02T06:00:00'
+
+    rows.append({'date': '2026-02-01', 'price': 11.0})
+    assert fetch_daily_data.update_commodity(commodity, '2026-02-02T06:00:00') is True
+    assert len(saves) == 2
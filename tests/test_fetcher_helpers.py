@@ -1,5 +1,9 @@
 """Tests for fetcher shared utilities and extracted pure helpers."""
 
+import math
+import os
+import stat
+from datetime import date, datetime
 from typing import Any, Dict, List
 
 import pytest
@@ -11,9 +15,11 @@ from scripts.fetchers._shared import (
     SmartDateParser,
     build_commodity_record,
     compute_metrics,
+    loads_json,
     merge_history,
     parse_records,
     safe_get,
+    save_atomic,
 )
 from scripts.fetchers.eia import _build_eia_params  # pyright: ignore[reportPrivateUsage]
 from scripts.fetchers.usda import _resolve_month, _parse_usda_records  # pyright: ignore[reportPrivateUsage]
@@ -35,10 +41,30 @@ class TestSmartDateParser:
 
     def test_fast_path_reuses_last_format(self) -> None:
         p = SmartDateParser()
-        p.parse("2026-01-01")
-        assert p._last_working_fmt == "%Y-%m-%d"  # pyright: ignore[reportPrivateUsage]
+        p.parse("01/15/2026")
+        assert p._last_working_fmt == "%m/%d/%Y"  # pyright: ignore[reportPrivateUsage]
         # Second call uses fast path
-        assert p.parse("2026-12-31") == "2026-12-31"
+        assert p.parse("12/31/2026") == "2026-12-31"
+
+    def test_iso_regex_path_validates_like_strptime(self) -> None:
+        p = SmartDateParser()
+        assert p.parse("2026-02-28 23:59:59") == "2026-02-28"
+        assert p._last_working_fmt is None  # pyright: ignore[reportPrivateUsage]
+        assert p.parse("2026-02-30") is None
+        assert p.parse("2026-02-28T24:00:00") is None
+
+    def test_rejects_non_ascii_digits(self) -> None:
+        p = SmartDateParser()
+        # Arabic-Indic digits: \d would match them, but strptime does not accept them.
+        assert p.parse("\u0662\u0660\u0662\u0666-\u0660\u0661-\u0660\u0665") is None
+        assert p.parse("\u0660\u0661/15/2026") is None
+
+    def test_falls_back_when_remembered_format_does_not_fit(self) -> None:
+        p = SmartDateParser()
+        assert p.parse("01/15/2026") == "2026-01-15"  # US
+        assert p.parse("15/01/2026") == "2026-01-15"  # EU: month 15 rules out US
+        assert p.parse("20260105") == "2026-01-05"
+        assert p.parse("not a date") is None
 
     def test_empty_returns_none(self) -> None:
         p = SmartDateParser()
@@ -98,6 +124,48 @@ class TestMergeHistory:
         merged = merge_history([], [{"date": "2026-01-01", "price": 50}])
         assert len(merged) == 1
 
+    def test_interleaves_sorted_inputs(self) -> None:
+        existing: List[Observation] = [
+            {"date": "2026-01-01", "price": 1},
+            {"date": "2026-01-03", "price": 3},
+            {"date": "2026-01-05", "price": 5},
+        ]
+        new: List[Observation] = [
+            {"date": "2026-01-02", "price": 2},
+            {"date": "2026-01-03", "price": 30},
+            {"date": "2026-01-06", "price": 6},
+        ]
+        merged = merge_history(existing, new)
+        assert [(m["date"], m["price"]) for m in merged] == [
+            ("2026-01-01", 1), ("2026-01-02", 2), ("2026-01-03", 30),
+            ("2026-01-05", 5), ("2026-01-06", 6),
+        ]
+
+    def test_append_and_tail_revision_keep_the_older_prefix(self) -> None:
+        existing: List[Observation] = [
+            {"date": f"2026-01-{d:02d}", "price": d} for d in range(1, 6)
+        ]
+        appended = merge_history(existing, [{"date": "2026-01-06", "price": 6}])
+        assert [m["price"] for m in appended] == [1, 2, 3, 4, 5, 6]
+
+        revised = merge_history(existing, [{"date": "2026-01-05", "price": 50}])
+        assert [m["price"] for m in revised] == [1, 2, 3, 4, 50]
+        assert revised[0] is existing[0]
+
+        assert merge_history(existing, []) == existing
+
+    def test_unsorted_or_repeated_dates_use_dict_fallback(self) -> None:
+        existing: List[Observation] = [
+            {"date": "2026-01-03", "price": 3},
+            {"date": "2026-01-01", "price": 1},
+            {"date": "2026-01-03", "price": 33},  # later duplicate wins
+        ]
+        new: List[Observation] = [{"date": "2026-01-02", "price": 2}]
+        merged = merge_history(existing, new)
+        assert [(m["date"], m["price"]) for m in merged] == [
+            ("2026-01-01", 1), ("2026-01-02", 2), ("2026-01-03", 33),
+        ]
+
     def test_skips_dateless_observations_instead_of_collapsing(self) -> None:
         # Two dateless entries must NOT collapse into a single '' bucket.
         existing: List[Observation] = [
@@ -157,6 +225,13 @@ class TestBuildCommodityRecord:
         assert record["name"] == "new"
         assert record["category"] == "energy"
 
+    def test_uses_the_given_run_timestamp(self) -> None:
+        history: List[Observation] = [{"date": "2026-02-01", "price": 5.0}]
+        record = build_commodity_record(
+            {}, history, compute_metrics(history), updated_at="2026-02-02T06:00:00"
+        )
+        assert record["updated_at"] == "2026-02-02T06:00:00"
+
     def test_does_not_mutate_input(self) -> None:
         existing = {"id": "x", "price": 1.0}
         history: List[Observation] = [{"date": "2026-03-01", "price": 9.0}]
@@ -183,6 +258,22 @@ class _FakeResponse:
 
 
 class TestSafeGet:
+    def test_retry_policy_adapts_to_urllib3_keywords(self) -> None:
+        class Urllib3V2:
+            def __init__(self, total, allowed_methods, backoff_factor, status_forcelist,
+                         respect_retry_after_header, raise_on_status, backoff_jitter=0.0):
+                self.methods, self.jitter = allowed_methods, backoff_jitter
+
+        class Urllib3V125:
+            def __init__(self, total, method_whitelist, backoff_factor, status_forcelist,
+                         respect_retry_after_header, raise_on_status):
+                self.methods, self.jitter = method_whitelist, None
+
+        modern = _shared._build_retry(Urllib3V2)
+        assert (modern.methods, modern.jitter) == (frozenset({"GET"}), 1.0)
+        legacy = _shared._build_retry(Urllib3V125)
+        assert (legacy.methods, legacy.jitter) == (frozenset({"GET"}), None)
+
     def test_uses_module_session(self, monkeypatch: pytest.MonkeyPatch) -> None:
         seen: Dict[str, Any] = {}
 
@@ -197,6 +288,13 @@ class TestSafeGet:
         assert seen["stream"] is True
         assert resp.content == b"{}"
 
+    def test_session_adapter_retries_transient_statuses(self) -> None:
+        retry = _shared._SESSION.get_adapter("https://api.stlouisfed.org").max_retries
+        assert retry.total == 3
+        assert {429, 503}.issubset(retry.status_forcelist)
+        assert retry.respect_retry_after_header is True
+        assert retry.allowed_methods == frozenset({"GET"})
+
     def test_rejects_oversized_declared_length(self, monkeypatch: pytest.MonkeyPatch) -> None:
         too_big = str(_shared.MAX_RESPONSE_BYTES + 1)
 
@@ -205,7 +303,7 @@ class TestSafeGet:
 
         monkeypatch.setattr(_shared._SESSION, "get", fake_get)
         with pytest.raises(requests.exceptions.RequestException):
-            safe_get("http://example.test", retries=1)
+            safe_get("http://example.test")
 
     def test_rejects_oversized_streamed_body(self, monkeypatch: pytest.MonkeyPatch) -> None:
         big_body = b"x" * (_shared.MAX_RESPONSE_BYTES + 1)
@@ -215,7 +313,79 @@ class TestSafeGet:
 
         monkeypatch.setattr(_shared._SESSION, "get", fake_get)
         with pytest.raises(requests.exceptions.RequestException):
-            safe_get("http://example.test", retries=1)
+            safe_get("http://example.test")
+
+
+# ---------------------------------------------------------------------------
+# JSON codec + save_atomic
+# ---------------------------------------------------------------------------
+
+class TestJsonIO:
+    def test_save_atomic_round_trips_with_stringified_defaults(self, tmp_path) -> None:
+        path = tmp_path / "gold.json"
+        data = {"id": "gold", "history": [{"date": "2026-01-02", "price": 1.5}], "when": date(2026, 1, 2)}
+
+        assert save_atomic(str(path), data) is True
+
+        raw = path.read_bytes()
+        assert raw.startswith(b'{\n  "id": "gold"')
+        assert loads_json(raw) == {**data, "when": "2026-01-02"}
+        assert list(tmp_path.iterdir()) == [path]  # no temp file left behind
+
+    def test_save_atomic_keeps_readable_file_modes(self, tmp_path) -> None:
+        existing = tmp_path / "gold.json"
+        existing.write_bytes(b"{}")
+        os.chmod(existing, 0o640)
+        assert save_atomic(str(existing), {"id": "gold"}) is True
+        assert stat.S_IMODE(os.stat(existing).st_mode) == 0o640
+
+        fresh = tmp_path / "silver.json"
+        assert save_atomic(str(fresh), {"id": "silver"}) is True
+        assert stat.S_IMODE(os.stat(fresh).st_mode) == 0o666 & ~_shared._UMASK
+
+    def test_save_atomic_failure_keeps_previous_file(self, tmp_path, monkeypatch: pytest.MonkeyPatch) -> None:
+        path = tmp_path / "gold.json"
+        path.write_bytes(b'{"id": "gold"}')
+
+        def failing_sync(fd: int) -> None:
+            raise OSError("disk full")
+
+        monkeypatch.setattr(_shared, "_fdatasync", failing_sync)
+
+        assert save_atomic(str(path), {"id": "new"}) is False
+        assert path.read_bytes() == b'{"id": "gold"}'
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_dumps_json_matches_without_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("orjson")
+        data = {
+            "name": "Café au lait",
+            "updated_at": datetime(2026, 1, 2, 3, 4, 5),
+            "as_of": date(2026, 1, 2),
+            "metrics": {"pct_1d": float("nan"), "max": float("inf"), "ratio": 0.25},
+            "history": [{"date": "2026-01-02", "price": 1.5}],
+            "tags": [],
+            "big": 2**70,
+        }
+        tiny = {"p": 1e-05}
+        with_orjson = _shared.dumps_json(data)
+        tiny_with_orjson = _shared.dumps_json(tiny)
+        monkeypatch.setattr(_shared, "orjson", None)
+        without_orjson = _shared.dumps_json(data)
+
+        assert with_orjson == without_orjson
+        assert '"name": "Café au lait"'.encode() in without_orjson
+        assert b'"updated_at": "2026-01-02 03:04:05"' in without_orjson
+        assert b'"pct_1d": null' in without_orjson
+        # Exponent floats are spelled differently but read back identically.
+        assert loads_json(tiny_with_orjson) == loads_json(_shared.dumps_json(tiny)) == tiny
+
+    def test_loads_json_accepts_nan_literals(self) -> None:
+        assert math.isnan(loads_json(b'{"price": NaN}')["price"])
+
+    def test_loads_json_rejects_invalid_input(self) -> None:
+        with pytest.raises(ValueError):
+            loads_json(b"{not json")
 
 
 # ---------------------------------------------------------------------------
@@ -297,6 +467,11 @@ class TestTimestampsToObservations:
         assert result[0]["date"] == "2026-01-01"
         assert result[1]["price"] == 200.0
 
+    def test_uses_utc_calendar_day(self) -> None:
+        # 23:59:59 UTC on 2025-12-31, then a pre-1970 stamp (1969-12-31 12:00 UTC)
+        result = _timestamps_to_observations([1767225599, -43200], [1.0, 2.0])
+        assert [r["date"] for r in result] == ["2025-12-31", "1969-12-31"]
+
     def test_skips_none_prices(self) -> None:
         result = _timestamps_to_observations([1767225600], [None])
         assert result == []
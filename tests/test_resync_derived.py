@@ -0,0 +1,42 @@
+import json
+
+from pytest import MonkeyPatch
+
+import scripts.resync_derived as resync_derived
+
+
+def _write_stale(tmp_path):
+    data_dir = tmp_path / 'data'
+    data_dir.mkdir()
+    path = data_dir / 'gold.json'
+    path.write_text(json.dumps({
+        'price': 1.0,
+        'date': '2026-01-01',
+        'history': [{'date': '2026-01-01', 'price': 1.0}, {'date': '2026-01-02', 'price': 2.0}],
+    }))
+    return path
+
+
+def test_main_resyncs_stale_file(tmp_path, monkeypatch: MonkeyPatch):
+    path = _write_stale(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    assert resync_derived.main() == 0
+
+    written = json.loads(path.read_text())
+    assert (written['price'], written['date']) == (2.0, '2026-01-02')
+    assert resync_derived.resync_file(str(path)) is None  # now current
+
+
+def test_failed_write_is_reported_not_treated_as_current(tmp_path, monkeypatch: MonkeyPatch, capsys):
+    path = _write_stale(tmp_path)
+    before = path.read_text()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(resync_derived, 'save_atomic', lambda path, data: False)
+
+    assert resync_derived.main() == 1
+
+    assert path.read_text() == before
+    out = capsys.readouterr()
+    assert 'FAILED gold.json' in out.err
+    assert '0 file(s) resynced, 1 failed' in out.out
@@ -5,6 +5,8 @@ unlike test_routes_helpers.py which tests helper functions in isolation.
 """
 import re
 
+import pytest
+
 # app_client fixture is provided by conftest.py
 
 
@@ -159,6 +161,35 @@ def test_api_commodity_detail_not_found(app_client):
     assert "error" in body
 
 
+# ------------------------------------------------------------------
+# JSON provider
+# ------------------------------------------------------------------
+
+def test_orjson_provider_matches_stdlib_conventions():
+    pytest.importorskip("orjson")
+    from datetime import datetime
+    from flask import Flask
+    from app.json_provider import JSONProvider, OrjsonProvider
+
+    app = Flask(__name__)
+    fast, stdlib = OrjsonProvider(app), JSONProvider(app)
+    payload = {
+        "b": 1,
+        "a": float("nan"),
+        "name": "Café",
+        "at": datetime(2024, 1, 2, 3, 4, 5),
+        "big": 2**70,
+        "rows": [{"p": 1.5}],
+    }
+
+    for kwargs in ({}, {"separators": (",", ":")}, {"indent": 2}, {"indent": 4}):
+        assert fast.dumps(payload, **kwargs) == stdlib.dumps(payload, **kwargs)
+    assert fast.dumps({"b": 1, "a": float("nan")}) == '{"a":null,"b":1}'
+    assert fast.dumps({1: "x"}) == stdlib.dumps({1: "x"}) == '{"1":"x"}'
+    assert fast.dumps({"big": 2**70}) == '{"big":1180591620717411303424}'
+    assert fast.loads('{"p": NaN}')["p"] != fast.loads('{"p": NaN}')["p"]
+
+
 # ------------------------------------------------------------------
 # Internal API endpoint
 # ------------------------------------------------------------------
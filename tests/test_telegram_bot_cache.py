@@ -0,0 +1,98 @@
+"""Tests for the Telegram bot's rendered-reply cache (get_cached_response/store_response).
+
+python-telegram-bot is not needed: the telegram modules, config and data_reader
+are stubbed so importing bots/telegram_bot.py only defines its handlers.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+
+def _stub(name, **attrs):
+    module = ModuleType(name)
+    module.__dict__.update(attrs)
+    return module
+
+
+@pytest.fixture
+def bot(monkeypatch):
+    """bots/telegram_bot.py loaded against stub dependencies, with a fake clock."""
+    bots_dir = Path(__file__).resolve().parents[1] / "bots"
+    stubs = {
+        "telegram": _stub("telegram", Update=SimpleNamespace(MESSAGE="message")),
+        "telegram.ext": _stub(
+            "telegram.ext",
+            Application=object,
+            CommandHandler=object,
+            ContextTypes=SimpleNamespace(DEFAULT_TYPE=object),
+        ),
+        "telegram.constants": _stub(
+            "telegram.constants", ParseMode=SimpleNamespace(HTML="HTML", MARKDOWN="Markdown")
+        ),
+        "config": _stub(
+            "config",
+            TELEGRAM_BOT_TOKEN="x",
+            WEBSITE_URL="https://example.test",
+            BOT_NAME="TestBot",
+            CATEGORIES={},
+        ),
+        "data_reader": _stub(
+            "data_reader",
+            get_commodity_data=None,
+            get_commodities_by_category=None,
+            format_price_message=None,
+            format_compact_price=None,
+            get_top_movers=None,
+            get_available_commodities=None,
+            search_commodity=None,
+        ),
+    }
+    for name, module in stubs.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+    spec = importlib.util.spec_from_file_location("telegram_bot", bots_dir / "telegram_bot.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    module.clock = clock
+    return module
+
+
+def test_cached_response_is_served_within_ttl(bot):
+    key = ("price", "gold")
+    assert bot.get_cached_response(key) is None
+
+    assert bot.store_response(key, "Gold: 2000") == "Gold: 2000"
+    bot.clock.now += bot.RESPONSE_CACHE_TTL - 1
+
+    assert bot.get_cached_response(key) == "Gold: 2000"
+    assert bot.get_cached_response(("price", "silver")) is None
+
+
+def test_cached_response_expires_after_ttl(bot):
+    key = ("top", "")
+    bot.store_response(key, "movers")
+
+    bot.clock.now += bot.RESPONSE_CACHE_TTL
+
+    assert bot.get_cached_response(key) is None
+    bot.store_response(key, "fresh movers")
+    assert bot.get_cached_response(key) == "fresh movers"
+
+
+def test_cache_is_cleared_once_it_reaches_max_entries(bot):
+    for i in range(bot.RESPONSE_CACHE_MAX_ENTRIES):
+        bot.store_response(("price", f"q{i}"), f"reply {i}")
+    assert len(bot._RESPONSE_CACHE) == bot.RESPONSE_CACHE_MAX_ENTRIES
+    assert bot.get_cached_response(("price", "q0")) == "reply 0"
+
+    bot.store_response(("price", "one more"), "latest")
+
+    assert bot._RESPONSE_CACHE.keys() == {("price", "one more")}
+    assert bot.get_cached_response(("price", "q0")) is None
+    assert bot.get_cached_response(("price", "one more")) == "latest"